@@ -3,10 +3,25 @@ src/persistra/core/io.py
 
 Handles serialization of the Project graph using Pickle.
 """
+import functools
 import pickle
+from importlib import metadata
 from typing import Any
 from persistra.core.project import Project
 
+
+@functools.lru_cache(maxsize=1)
+def get_app_version() -> str:
+    """
+    Returns the installed Persistra version.
+    Cached: the metadata lookup hits the filesystem only once.
+    """
+    try:
+        return metadata.version("persistra")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
 def save_project(project: Project, filepath: str):
     """
     Saves the entire project state to a binary file.
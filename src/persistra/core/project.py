@@ -7,6 +7,26 @@ This file contains NO GUI code.
 import uuid
 from typing import List, Dict, Type, Any, Optional
 from persistra.core.objects import DataWrapper, Parameter
+from persistra.core.types import SocketDef
+
+# Normalized socket definitions per Operation class. Socket specs are
+# declared as dicts and identical for every instance of a class, so the
+# dict -> SocketDef conversion runs once per class instead of once per
+# Node construction; nodes then only allocate their Socket objects.
+_SOCKETDEF_CACHE: Dict[type, tuple] = {}
+
+
+def _socket_defs(operation: "Operation") -> tuple:
+    defs = _SOCKETDEF_CACHE.get(type(operation))
+    if defs is None:
+        defs = (
+            tuple(SocketDef(spec['name'], spec['type'])
+                  for spec in operation.inputs),
+            tuple(SocketDef(spec['name'], spec['type'])
+                  for spec in operation.outputs),
+        )
+        _SOCKETDEF_CACHE[type(operation)] = defs
+    return defs
 
 # --- The Logic Definition ---
 
@@ -113,11 +133,12 @@ class Node:
         self.output_sockets: List[Socket] = []
         self.parameters: List[Parameter] = self.operation.parameters
 
-        for inp in self.operation.inputs:
-            self.input_sockets.append(Socket(self, inp['name'], inp['type'], is_input=True))
-            
-        for out in self.operation.outputs:
-            self.output_sockets.append(Socket(self, out['name'], out['type'], is_input=False))
+        input_defs, output_defs = _socket_defs(self.operation)
+        for inp in input_defs:
+            self.input_sockets.append(Socket(self, inp.name, inp.socket_type, is_input=True))
+
+        for out in output_defs:
+            self.output_sockets.append(Socket(self, out.name, out.socket_type, is_input=False))
 
     def get_input_socket(self, name: str) -> Optional[Socket]:
         return next((s for s in self.input_sockets if s.name == name), None)
@@ -204,6 +225,15 @@ class Project:
         self.nodes.append(node)
         return node
 
+    def connect(self, source_node: Node, output_name: str,
+                target_node: Node, input_name: str):
+        """Connects an output socket of one node to an input of another."""
+        source = source_node.get_output_socket(output_name)
+        target = target_node.get_input_socket(input_name)
+        if source is None or target is None:
+            raise KeyError(f"Unknown socket: {output_name} -> {input_name}")
+        source.connect_to(target)
+
     def remove_node(self, node: Node):
         if node in self.nodes:
             # Disconnect all sockets first
@@ -0,0 +1,52 @@
+"""
+src/persistra/core/recent.py
+
+Bookkeeping for the recently-opened project list (~/.persistra/recent.json).
+"""
+import json
+import os
+from pathlib import Path
+from typing import List
+
+MAX_RECENT = 10
+
+
+def _recent_file() -> Path:
+    home = os.environ.get("PERSISTRA_HOME", Path.home() / ".persistra")
+    return Path(home) / "recent.json"
+
+
+def load_recent_projects() -> List[str]:
+    """Returns the recent project paths, most recent first."""
+    try:
+        with open(_recent_file(), "r", encoding="utf-8") as f:
+            entries = json.load(f)
+    except (OSError, ValueError):
+        return []
+    return [e for e in entries if isinstance(e, str)]
+
+
+def commit_save(filepath: str) -> List[str]:
+    """
+    Single atomic metadata update performed after a project save.
+
+    All bookkeeping (recent-list promotion, pruning) happens in memory and
+    lands on disk as one buffered write + fsync + rename, instead of one
+    read-modify-write cycle per step.
+    """
+    entries = load_recent_projects()
+    filepath = str(filepath)
+    if filepath in entries:
+        entries.remove(filepath)
+    entries.insert(0, filepath)
+    del entries[MAX_RECENT:]
+
+    path = _recent_file()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(entries, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    return entries
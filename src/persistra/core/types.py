@@ -0,0 +1,168 @@
+"""
+src/persistra/core/types.py
+
+Socket type descriptors used for connection validation.
+Ref: IMPROVEMENT-PLAN.md Section 4.1
+"""
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Optional, Type
+
+# Shape tuples arrive from dict-based socket defs, so equal constraints
+# are built over and over as distinct tuples. Interning them (and the
+# dtype strings, which contain no identifier-interning guarantee) makes
+# the hot exact-match comparisons and the memo-cache key hashing work on
+# shared objects, where equality degenerates to pointer identity.
+_SHAPE_INTERN: dict = {}
+
+
+class SocketType:
+    """Base class for all socket type descriptors."""
+
+    def accepts(self, other: "SocketType") -> bool:
+        """Return True if data described by `other` can flow into a socket
+        of this type."""
+        raise NotImplementedError
+
+
+class ConcreteType(SocketType):
+    """Exact DataWrapper subclass, optionally with dtype/shape constraints.
+
+    Instances are immutable and hashable. The accepts() answer for a
+    given pair of types can therefore never change, so the pairwise
+    decision is memoized module-wide: re-validating connections across a
+    large graph costs one dict hit per edge instead of an MRO walk plus
+    dtype/shape comparisons.
+    """
+
+    __slots__ = ("wrapper_cls", "dtype", "shape", "_key", "_hash",
+                 "_mro_set")
+
+    def __init__(self, wrapper_cls: Type, *, dtype: Optional[str] = None,
+                 shape: Optional[tuple] = None):
+        self.wrapper_cls = wrapper_cls
+        if isinstance(dtype, str):
+            dtype = sys.intern(dtype)
+        self.dtype = dtype      # e.g. "float64"
+        if shape is not None:
+            shape = _SHAPE_INTERN.setdefault(shape, shape)
+        self.shape = shape      # e.g. (None, 3); None = any size on that axis
+        self._key = (wrapper_cls, dtype, shape)
+        # Precomputed: instances are used as cache keys on every lookup
+        self._hash = hash(self._key)
+        # Flattened ancestry: 'target_cls in source._mro_set' is one hash
+        # probe, where issubclass walks the MRO tuple at C level per call
+        self._mro_set = frozenset(wrapper_cls.__mro__)
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        return (isinstance(other, ConcreteType)
+                and self._key == other._key)
+
+    def __repr__(self):
+        return (f"ConcreteType({self.wrapper_cls.__name__}, "
+                f"dtype={self.dtype!r}, shape={self.shape!r})")
+
+    def accepts(self, other: SocketType) -> bool:
+        if other is ANY:
+            return True
+        if isinstance(other, ConcreteType):
+            return _concrete_accepts(self, other)
+        if isinstance(other, UnionType):
+            return any(self.accepts(t) for t in other.types)
+        if isinstance(other, AnyType):
+            return True
+        return False
+
+
+@lru_cache(maxsize=4096)
+def _concrete_accepts(target: ConcreteType, source: ConcreteType) -> bool:
+    """Pairwise concrete-vs-concrete decision, memoized.
+
+    Safe to cache unconditionally: both operands are immutable, so the
+    cache never needs invalidation.
+    """
+    if target.wrapper_cls not in source._mro_set:
+        # The set covers ordinary (including multiple) inheritance;
+        # issubclass only remains for virtual subclasses (ABC.register)
+        if not issubclass(source.wrapper_cls, target.wrapper_cls):
+            return False
+    if target.dtype and source.dtype and target.dtype != source.dtype:
+        return False
+    if target.shape and source.shape:
+        if len(target.shape) != len(source.shape):
+            return False
+        for t_dim, s_dim in zip(target.shape, source.shape):
+            if t_dim is not None and t_dim != s_dim:
+                return False
+    return True
+
+
+class UnionType(SocketType):
+    """Socket accepts any of several concrete types."""
+
+    def __init__(self, *types: SocketType):
+        self.types = types
+        # Concrete members indexed by wrapper class: a concrete source
+        # whose class matches a member resolves with one dict lookup
+        # instead of a linear any() over all members.
+        self._by_cls = {t.wrapper_cls: t for t in types
+                        if isinstance(t, ConcreteType)}
+
+    def accepts(self, other: SocketType) -> bool:
+        if other is ANY:
+            return True
+        if isinstance(other, ConcreteType):
+            member = self._by_cls.get(other.wrapper_cls)
+            if member is not None and member.accepts(other):
+                return True
+            # Subclass sources (or dtype/shape mismatches on the exact
+            # member) can still be accepted by another member
+            return any(t.accepts(other) for t in self.types
+                       if t is not member)
+        return any(t.accepts(other) for t in self.types)
+
+
+class AnyType(SocketType):
+    """Socket accepts any DataWrapper.
+
+    Stateless, so a slotted singleton: every construction returns the
+    same instance and the other descriptors can recognize an AnyType
+    source with an identity compare against ANY instead of an
+    isinstance call.
+    """
+
+    __slots__ = ()
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def accepts(self, other: SocketType) -> bool:
+        return True
+
+
+# The shared AnyType instance; identity checks against it short-circuit
+# the dispatch in ConcreteType.accepts/UnionType.accepts.
+ANY = AnyType()
+
+
+@dataclass(frozen=True)
+class SocketDef:
+    """Declarative socket definition shared by Operation subclasses.
+
+    Frozen so one normalized instance can back the sockets of every
+    node of an operation class (see the per-class cache in
+    persistra.core.project).
+    """
+    name: str
+    socket_type: Any  # SocketType descriptor or a raw DataWrapper class
+    required: bool = True
+    description: str = ""
@@ -0,0 +1,56 @@
+"""
+src/persistra/core/validation.py
+
+Graph validation checks run before execution.
+"""
+from dataclasses import dataclass
+from typing import List, Optional, Set
+
+from persistra.core.project import Project, Node
+
+
+@dataclass
+class ValidationMessage:
+    level: str      # "error", "warning" or "info"
+    node_id: str
+    message: str
+
+
+class GraphValidator:
+    """Validates a Project graph and reports problems per node."""
+
+    def validate(self, project: Project,
+                 dirty: Optional[Set[str]] = None) -> List[ValidationMessage]:
+        """
+        Runs all checks and returns the collected messages.
+
+        If `dirty` is given, only nodes whose id is in the set are
+        inspected, so validation cost scales with edited nodes rather
+        than the full graph.
+        """
+        nodes = project.nodes
+        if dirty is not None:
+            nodes = [n for n in nodes if n.id in dirty]
+
+        messages: List[ValidationMessage] = []
+        for node in nodes:
+            messages.extend(self._check_required_inputs(node))
+            messages.extend(self._check_orphans(node))
+        return messages
+
+    def _check_required_inputs(self, node: Node) -> List[ValidationMessage]:
+        msgs = []
+        for sock in node.input_sockets:
+            if not sock.connections:
+                msgs.append(ValidationMessage(
+                    "error", node.id,
+                    f"{node.operation.name}: input '{sock.name}' is not connected"))
+        return msgs
+
+    def _check_orphans(self, node: Node) -> List[ValidationMessage]:
+        sockets = node.input_sockets + node.output_sockets
+        if sockets and not any(s.connections for s in sockets):
+            return [ValidationMessage(
+                "warning", node.id,
+                f"{node.operation.name}: node is not connected to the graph")]
+        return []
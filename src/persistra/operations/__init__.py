@@ -5,6 +5,8 @@ Registry of all available operations.
 The UI Node Browser will import 'available_operations' to populate its list.
 """
 
+from sys import intern as _intern
+
 from .io import CSVLoader
 from .tda import SlidingWindow, RipsPersistence
 from .viz import LinePlot, PersistencePlot
@@ -30,3 +32,16 @@ OPERATIONS_REGISTRY = {
 
 # Flat list if needed for lookups
 ALL_OPERATIONS = [op for cat in OPERATIONS_REGISTRY.values() for op in cat]
+
+# Name -> class lookup used when a browser leaf is dropped on the canvas
+OPERATIONS_BY_NAME = {op.name: op for op in ALL_OPERATIONS}
+
+# Cached display name: the UI reads this once per selection instead of
+# walking operation.__class__.__name__ on every set_node call. Category
+# strings are interned to match the theme's interned color-map keys, so
+# the per-paint lookup degenerates to a pointer compare.
+for _op in ALL_OPERATIONS:
+    _op._display_name = _op.__name__
+    if isinstance(getattr(_op, "category", None), str):
+        _op.category = _intern(_op.category)
+del _op
@@ -0,0 +1,67 @@
+"""
+src/persistra/ui/actions.py
+
+Shared QActions for application commands. The menu bar and the toolbar
+attach the same instances, so each command has one signal path and
+enabled/checked state stays in sync for free.
+"""
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QAction, QKeySequence
+from PyQt6.QtWidgets import QStyle
+
+from persistra.ui.icons import bundled_icon
+
+# QIcons returned by QStyle.standardIcon, keyed by StandardPixmap value.
+# Shared so rebuilt widgets reuse the decoded pixmaps instead of querying
+# the style again.
+_ICON_CACHE = {}
+
+
+def _icon(style, pixmap: QStyle.StandardPixmap):
+    icon = _ICON_CACHE.get(pixmap)
+    if icon is None:
+        icon = style.standardIcon(pixmap)
+        _ICON_CACHE[pixmap] = icon
+    return icon
+
+
+class ActionRegistry:
+    """
+    Owns one QAction per application command, parented to the main window.
+    Shortcuts use application scope, so they dispatch through QShortcutMap
+    without any menu being realized.
+    """
+
+    def __init__(self, window):
+        style = window.style()
+        SP = QStyle.StandardPixmap
+
+        self.new_project = self._make(
+            window, "&New Project", "Ctrl+N", _icon(style, SP.SP_FileIcon))
+        self.open_project = self._make(
+            window, "&Open Project...", "Ctrl+O",
+            _icon(style, SP.SP_DialogOpenButton))
+        self.save_project = self._make(
+            window, "&Save", "Ctrl+S", _icon(style, SP.SP_DialogSaveButton))
+        self.save_project_as = self._make(
+            window, "Save &As...", "Ctrl+Shift+S")
+        self.select_all = self._make(window, "Select &All", "Ctrl+A")
+        self.validate_graph = self._make(
+            window, "&Validate Graph", "Ctrl+Shift+V")
+        self.zoom_to_fit = self._make(
+            window, "Zoom to &Fit", "Ctrl+0",
+            _icon(style, SP.SP_FileDialogContentsView))
+        self.toggle_theme = self._make(
+            window, "Toggle &Theme", "Ctrl+T", bundled_icon("theme_sun"))
+        self.about = self._make(window, "&About Persistra", None)
+
+    @staticmethod
+    def _make(window, text, shortcut, icon=None):
+        action = QAction(text, window)
+        if icon is not None:
+            action.setIcon(icon)
+        if shortcut:
+            action.setShortcut(QKeySequence(shortcut))
+            action.setShortcutContext(Qt.ShortcutContext.ApplicationShortcut)
+        window.addAction(action)
+        return action
@@ -19,7 +19,10 @@ class SocketItem(QGraphicsItem):
         self.is_input = is_input
         self.socket_name = socket_name
         self.setAcceptHoverEvents(True)
-        
+
+        # Cache the rendered ellipse as a texture; repaints become a blit
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+
         # Track connected wires to update them when the parent node moves
         self.wires = [] 
         
@@ -30,6 +33,14 @@ class SocketItem(QGraphicsItem):
     def add_wire(self, wire: 'WireItem'):
         self.wires.append(wire)
 
+    def hoverEnterEvent(self, event):
+        self.update()  # Invalidate the cached pixmap so the hover color shows
+        super().hoverEnterEvent(event)
+
+    def hoverLeaveEvent(self, event):
+        self.update()
+        super().hoverLeaveEvent(event)
+
     def boundingRect(self) -> QRectF:
         return QRectF(-self.RADIUS, -self.RADIUS, 2 * self.RADIUS, 2 * self.RADIUS)
 
@@ -52,10 +63,14 @@ class NodeItem(QGraphicsItem):
         self.node_data = node_data
         
         # ItemSendsGeometryChanges is required for itemChange to detect position updates
-        self.setFlags(QGraphicsItem.GraphicsItemFlag.ItemIsMovable | 
+        self.setFlags(QGraphicsItem.GraphicsItemFlag.ItemIsMovable |
                       QGraphicsItem.GraphicsItemFlag.ItemIsSelectable |
                       QGraphicsItem.GraphicsItemFlag.ItemSendsGeometryChanges)
-        
+
+        # Node visuals are static between state changes: cache them as a
+        # device-coordinate texture instead of repainting every frame.
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+
         # FIX: Access the initialized Socket objects from the Node model.
         # The backend 'Node' class creates 'input_sockets' and 'output_sockets' lists
         # containing objects with a .name attribute.
@@ -87,16 +102,28 @@ class NodeItem(QGraphicsItem):
         Detects position changes and updates connected wires.
         """
         if change == QGraphicsItem.GraphicsItemChange.ItemPositionHasChanged:
+            # Keep the model position in sync so save/load restores layout
+            self.node_data.position = (self.pos().x(), self.pos().y())
+            scene = self.scene()
+            if scene is not None:
+                scene.node_moved.emit(self, self.pos())
             # Iterate through all input and output sockets
             for socket in self.inputs + self.outputs:
                 # Update every wire attached to these sockets
                 for wire in socket.wires:
                     wire.update_path()
-                    
+        elif change == QGraphicsItem.GraphicsItemChange.ItemSelectedHasChanged:
+            # Selection changes the border color; invalidate the cached pixmap
+            self.update()
+
         return super().itemChange(change, value)
 
     def boundingRect(self) -> QRectF:
-        return QRectF(0, 0, self.WIDTH, self.height)
+        # Include the selection pen width so dirty-rect viewport updates
+        # never leave trails from the highlighted border.
+        pen_margin = 2.0
+        return QRectF(0, 0, self.WIDTH, self.height).adjusted(
+            -pen_margin, -pen_margin, pen_margin, pen_margin)
 
     def paint(self, painter: QPainter, option: QStyleOptionGraphicsItem, widget):
         # Draw Background
@@ -1,17 +1,37 @@
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QObject, QRectF, Qt, pyqtSignal, pyqtSlot
 from persistra.ui.graph.scene import GraphScene
 from persistra.ui.graph.items import NodeItem, WireItem, SocketItem
 from persistra.ui.graph.worker import Worker
 # Import the REAL backend
 from persistra.core.project import Project 
 
+# The operations registry imports matplotlib-backed modules, so it is
+# resolved lazily to keep manager import light; after the first call the
+# binding is cached here and the per-drop import statement (and its
+# sys.modules/_handle_fromlist round-trip) disappears.
+_operations_by_name = None
+
+
+def _get_operations_by_name():
+    global _operations_by_name
+    if _operations_by_name is None:
+        from persistra.operations import OPERATIONS_BY_NAME
+        _operations_by_name = OPERATIONS_BY_NAME
+    return _operations_by_name
+
 class GraphManager(QObject):
     """
     The Controller logic. Mediates between Project (Model) and GraphScene (View).
+
+    Thread affinity: the manager lives on the GUI thread. Worker signals are
+    the only cross-thread hop and are relayed here via explicit queued
+    connections; computation_started/computation_finished are therefore
+    always emitted on the GUI thread, so downstream connects stay direct.
     """
     node_selected = pyqtSignal(object)
     computation_started = pyqtSignal(str) # Message to show in status bar
-    computation_finished = pyqtSignal(object) # Result to send to VizPanel
+    computation_finished = pyqtSignal(object, object) # (Node, result) for the VizPanel
+    graph_dirty = pyqtSignal(object)  # List of node ids touched by an edit
 
     def __init__(self, scene: GraphScene, project_model: Project):
         super().__init__()
@@ -19,41 +39,54 @@ class GraphManager(QObject):
         self.project = project_model
         
         self.node_map = {}  # {NodeItem: NodeModel}
-        self.wire_map = {}  # {WireItem: (SourceNode, TargetNode, ...)} 
+        self.wire_map = {}  # {WireItem: (SourceNode, TargetNode, ...)}
         self.current_worker = None
 
-        # Connect Scene Signals
-        self.scene.connection_requested.connect(self.handle_connection)
-        self.scene.selection_changed_custom.connect(self.handle_selection)
+        # Cached union of node item rects; avoids the O(N) scene walk that
+        # itemsBoundingRect() performs on every zoom_to_fit.
+        self._items_bbox_cache = None
+
+        # Connect Scene Signals. Scene and manager share the GUI thread
+        # (see the class docstring), so direct dispatch is safe and skips
+        # the per-emit affinity check.
+        self.scene.connection_requested.connect(
+            self.handle_connection, type=Qt.ConnectionType.DirectConnection)
+        self.scene.selection_changed_custom.connect(
+            self.handle_selection, type=Qt.ConnectionType.DirectConnection)
+        self.scene.node_moved.connect(
+            self.invalidate_bounds, type=Qt.ConnectionType.DirectConnection)
+
+    def invalidate_bounds(self, *args):
+        """Drops the cached items bounding rect (nodes added/removed/moved)."""
+        self._items_bbox_cache = None
+
+    def items_bounding_rect(self) -> QRectF:
+        """Union rect of all node items; recomputed only after invalidation."""
+        if self._items_bbox_cache is None:
+            rect = QRectF()
+            for item in self.node_map:
+                rect = rect.united(item.sceneBoundingRect())
+            self._items_bbox_cache = rect
+        return self._items_bbox_cache
 
     def add_node(self, operation_class_name: str, pos_x: float = 0, pos_y: float = 0):
-        """Creates a Node in the Model and View."""
-        # 1. Update Model (Real Backend)
-        from persistra.operations import OPERATIONS_REGISTRY
-        
-        # FIX: Handle Registry entries that might be [Class] or [Class, Metadata] lists
-        op_entry = OPERATIONS_REGISTRY.get(operation_class_name)
-        
-        if not op_entry:
+        """Creates a Node in the Model and View from a registry name."""
+        op_class = _get_operations_by_name().get(operation_class_name)
+
+        if op_class is None:
             print(f"Error: Operation '{operation_class_name}' not found in registry.")
             return
 
-        # If the registry returns a list (e.g., [Class, "Description"]), extract the Class
-        if isinstance(op_entry, list) or isinstance(op_entry, tuple):
-            op_class = op_entry[0]
-        else:
-            op_class = op_entry
-
-        # Safety check to ensure we actually have a class (callable)
-        if not callable(op_class):
-            print(f"Error: Registry entry for '{operation_class_name}' is not a callable class. Got: {type(op_class)}")
-            return
+        return self.add_node_from_class(op_class, pos_x, pos_y)
 
+    def add_node_from_class(self, op_class, pos_x: float = 0, pos_y: float = 0):
+        """Creates a Node from an already-resolved Operation class."""
+        # 1. Update Model (Real Backend)
         node_model = self.project.add_node(op_class)
         
         # Safety Check for Backend Return Value (from previous step)
         if node_model is None:
-            print(f"CRITICAL ERROR: Project.add_node() returned None for operation '{operation_class_name}'.")
+            print(f"CRITICAL ERROR: Project.add_node() returned None for operation '{op_class.__name__}'.")
             return
 
         # 2. Update View
@@ -62,8 +95,11 @@ class GraphManager(QObject):
         self.scene.addItem(node_item)
         
         self.node_map[node_item] = node_model
+        self.invalidate_bounds()
+        self.graph_dirty.emit([node_model.id])
         return node_item
 
+    @pyqtSlot(object, object)
     def handle_connection(self, start_socket: SocketItem, end_socket: SocketItem):
         if start_socket.is_input == end_socket.is_input: return
         if not start_socket.is_input: source, target = start_socket, end_socket
@@ -85,7 +121,9 @@ class GraphManager(QObject):
         self.scene.addItem(wire_item)
         
         self.wire_map[wire_item] = (source_node, target_node)
+        self.graph_dirty.emit([source_node.id, target_node.id])
 
+    @pyqtSlot(list)
     def handle_selection(self, selected_items):
         if not selected_items: return
         first_item = selected_items[0]
@@ -104,14 +142,20 @@ class GraphManager(QObject):
         self.computation_started.emit(f"Computing {node}...")
         
         self.current_worker = Worker(node)
-        self.current_worker.finished.connect(self._on_compute_finished)
-        self.current_worker.error.connect(self._on_compute_error)
+        # Explicitly queued: these cross from the worker thread, and typing
+        # the connection skips Qt's per-emit thread-affinity check.
+        self.current_worker.finished.connect(
+            self._on_compute_finished, type=Qt.ConnectionType.QueuedConnection)
+        self.current_worker.error.connect(
+            self._on_compute_error, type=Qt.ConnectionType.QueuedConnection)
         self.current_worker.start()
 
+    @pyqtSlot(object)
     def _on_compute_finished(self, result):
-        self.computation_finished.emit(result)
+        self.computation_finished.emit(self.current_worker.node, result)
         self.computation_started.emit("Ready")
 
+    @pyqtSlot(str)
     def _on_compute_error(self, error_msg):
         print(error_msg)
         self.computation_started.emit("Error during computation")
@@ -62,9 +62,12 @@ class GraphScene(QGraphicsScene):
         painter.setPen(QPen(QColor("#111111"), 2))
         lines_thick = []
         major_spacing = self.grid_size * self.grid_squares
-        
-        first_left_major = left - (left % major_spacing)
-        first_top_major = top - (top % major_spacing)
+
+        # Major anchors are a subset of the fine anchors (major_spacing is a
+        # multiple of grid_size), so reduce the already-snapped values instead
+        # of going back to the raw left/top.
+        first_left_major = first_left - (first_left % major_spacing)
+        first_top_major = first_top - (first_top % major_spacing)
 
         for x in range(first_left_major, right, major_spacing):
             lines_thick.append(QLineF(x, top, x, bottom).toLine())
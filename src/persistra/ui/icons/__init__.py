@@ -0,0 +1,21 @@
+"""
+src/persistra/ui/icons/__init__.py
+
+Bundled SVG icons. Loaded through a cache so each file is read and
+decoded once per process, regardless of how many widgets use it.
+"""
+from importlib import resources
+
+from PyQt6.QtGui import QIcon
+
+_BUNDLED_CACHE = {}
+
+
+def bundled_icon(name: str) -> QIcon:
+    """Returns the packaged icon `name` (without extension), cached."""
+    icon = _BUNDLED_CACHE.get(name)
+    if icon is None:
+        path = resources.files(__name__) / f"{name}.svg"
+        icon = QIcon(str(path))
+        _BUNDLED_CACHE[name] = icon
+    return icon
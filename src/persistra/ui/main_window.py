@@ -1,58 +1,172 @@
+import logging
 import sys
-from PyQt6.QtWidgets import (QMainWindow, QWidget, QGridLayout, 
-                             QGraphicsView, QLabel, QFrame, QStatusBar)
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QPainter
+from pathlib import Path
+from PyQt6.QtWidgets import (QMainWindow, QWidget, QGridLayout,
+                             QGraphicsView, QGraphicsScene, QLabel, QFrame,
+                             QStatusBar, QFileDialog, QMessageBox)
+from PyQt6.QtCore import (Qt, QObject, QRunnable, QThreadPool, QTimer,
+                          pyqtSignal, pyqtSlot)
+from PyQt6.QtGui import QPainter, QPainterPath, QSurfaceFormat
+
+try:
+    from PyQt6.QtOpenGLWidgets import QOpenGLWidget
+except ImportError:
+    # Fall back to the default raster viewport if OpenGL is unavailable
+    QOpenGLWidget = None
 
 # Import Custom UI
 from persistra.ui.graph.scene import GraphScene
 from persistra.ui.graph.manager import GraphManager
+from persistra.ui.graph.items import NodeItem, WireItem
 from persistra.ui.widgets.context_panel import ContextPanel
 from persistra.ui.widgets.node_browser import NodeBrowser
 from persistra.ui.widgets.viz_panel import VizPanel
+from persistra.ui.widgets.toolbar import PersistToolBar
+from persistra.ui.actions import ActionRegistry
+from persistra.ui.theme import ThemeManager
 
 # Import REAL Backend
 from persistra.core.project import Project
-from persistra.operations import OPERATIONS_REGISTRY 
+from persistra.core.io import save_project, load_project, get_app_version
+from persistra.core.recent import commit_save
+from persistra.core.validation import GraphValidator
+from persistra.operations import OPERATIONS_REGISTRY, OPERATIONS_BY_NAME
+
+logger = logging.getLogger(__name__)
+
+class _IOTaskSignals(QObject):
+    """Signal relay for _IOTask (QRunnable cannot emit signals itself)."""
+    finished = pyqtSignal(object)  # Result of the call (Project or None)
+    error = pyqtSignal(str)
+
+
+class _IOTask(QRunnable):
+    """Runs a blocking project save/load call on the global thread pool."""
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.signals = _IOTaskSignals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args)
+            self.signals.finished.emit(result)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+
 
 class GraphView(QGraphicsView):
     # ... (Same implementation as Step 5) ...
     def __init__(self, scene, manager, parent=None):
         super().__init__(scene, parent)
-        self.manager = manager 
+        self.manager = manager
+        # GPU-rasterize the scene: path tessellation and blitting move off
+        # the CPU, which is the hot path on graphs with many nodes/wires.
+        if QOpenGLWidget is not None:
+            self.setViewport(QOpenGLWidget())
         self.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self._aa_on = True  # LOD: antialiasing is dropped at low zoom
         self.setDragMode(QGraphicsView.DragMode.ScrollHandDrag)
-        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+        if QOpenGLWidget is not None:
+            # A QOpenGLWidget viewport does not preserve its framebuffer
+            # between paints (NoPartialUpdate), so dirty-rect repaints
+            # would leave stale regions; Qt recommends full updates here.
+            # The GPU re-rasterizes the whole scene cheaply anyway.
+            self.setViewportUpdateMode(
+                QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+        else:
+            # Raster fallback: repaint only the regions covered by changed
+            # items; drag/zoom cost then scales with the changed area.
+            self.setViewportUpdateMode(
+                QGraphicsView.ViewportUpdateMode.MinimalViewportUpdate)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.setAcceptDrops(True)
+        self._drag_op = None  # Operation class resolved at drag-enter
+
+        # Wheel ticks accumulate into one scale() per ~frame instead of one
+        # transform change per event (trackpads fire dozens per second).
+        self._pending_zoom = 1.0
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(16)
+        self._zoom_timer.timeout.connect(self._apply_pending_zoom)
 
     def wheelEvent(self, event):
         zoom_in_factor = 1.15
         zoom_out_factor = 1 / zoom_in_factor
         self.setTransformationAnchor(QGraphicsView.ViewportAnchor.AnchorUnderMouse)
-        if event.angleDelta().y() > 0: self.scale(zoom_in_factor, zoom_in_factor)
-        else: self.scale(zoom_out_factor, zoom_out_factor)
+        if event.angleDelta().y() > 0: self._pending_zoom *= zoom_in_factor
+        else: self._pending_zoom *= zoom_out_factor
+        if not self._zoom_timer.isActive():
+            self._zoom_timer.start()
+
+    def _apply_pending_zoom(self):
+        self.scale(self._pending_zoom, self._pending_zoom)
+        self._pending_zoom = 1.0
+        self._update_antialiasing()
+
+    def _update_antialiasing(self):
+        """Disables AA when zoomed out far enough that it buys nothing.
+
+        Path rasterization with AA is the most expensive render flag; at
+        overview zoom levels the nodes are too small for it to matter.
+        """
+        want_aa = self.transform().m11() >= 0.5
+        if want_aa != self._aa_on:
+            self._aa_on = want_aa
+            self.setRenderHint(QPainter.RenderHint.Antialiasing, want_aa)
 
     def dragEnterEvent(self, event):
-        if event.mimeData().hasText(): event.accept()
-        else: event.ignore()
+        # Resolve the operation once at drag start: unknown payloads are
+        # rejected here, before any drop can dirty the scene, and the drop
+        # itself skips the string lookup entirely.
+        op_name = event.mimeData().text() if event.mimeData().hasText() else ""
+        self._drag_op = OPERATIONS_BY_NAME.get(op_name)
+        if self._drag_op is not None:
+            event.accept()
+        else:
+            event.ignore()
 
     def dragMoveEvent(self, event):
-        if event.mimeData().hasText(): event.accept()
+        if self._drag_op is not None: event.accept()
         else: event.ignore()
 
+    def dragLeaveEvent(self, event):
+        self._drag_op = None
+        super().dragLeaveEvent(event)
+
     def dropEvent(self, event):
-        op_name = event.mimeData().text()
+        if self._drag_op is None:
+            event.ignore()
+            return
         scene_pos = self.mapToScene(event.position().toPoint())
-        self.manager.add_node(op_name, scene_pos.x(), scene_pos.y())
+        self.manager.add_node_from_class(self._drag_op, scene_pos.x(), scene_pos.y())
+        self._drag_op = None
         event.accept()
 
+    def zoom_to_fit(self):
+        """Fits all nodes into the viewport using the manager's cached rect."""
+        rect = self.manager.items_bounding_rect()
+        if rect.isNull():
+            return
+        self.fitInView(rect.adjusted(-50, -50, 50, 50),
+                       Qt.AspectRatioMode.KeepAspectRatio)
+        self._update_antialiasing()
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Persistra - Visual Analysis Tool")
-        self.resize(1280, 800) 
+        self.resize(1280, 800)
+
+        # Request 4x MSAA for the OpenGL viewport; must be the default format
+        # before any GL widget is constructed.
+        if QOpenGLWidget is not None:
+            surface_format = QSurfaceFormat()
+            surface_format.setSamples(4)
+            QSurfaceFormat.setDefaultFormat(surface_format)
         
         # Status Bar
         self.status_bar = QStatusBar()
@@ -67,30 +181,34 @@ class MainWindow(QMainWindow):
         self.layout = QGridLayout(central_widget)
         self.layout.setContentsMargins(5, 5, 5, 5)
         self.layout.setSpacing(5)
-        for c in range(16): self.layout.setColumnStretch(c, 1)
-        for r in range(10): self.layout.setRowStretch(r, 1)
-        
-        # 1. Node Browser
+        # Collapse the old 16x10 uniform grid to its actual structure: two
+        # columns (6:10) and three row bands (4:2:4) give the same geometry
+        # with five stretch calls instead of twenty-six.
+        self.layout.setColumnStretch(0, 6)
+        self.layout.setColumnStretch(1, 10)
+        self.layout.setRowStretch(0, 4)
+        self.layout.setRowStretch(1, 2)
+        self.layout.setRowStretch(2, 4)
+
+        # 1. Node Browser (lazy: categories now, operations on expand)
         self.node_browser = NodeBrowser()
-        # Populate from REAL Registry
-        for op_name in OPERATIONS_REGISTRY.keys():
-            self.node_browser.add_operation(op_name)
-        self.layout.addWidget(self.node_browser, 0, 0, 4, 6)
-        
+        self.node_browser.set_registry(OPERATIONS_REGISTRY)
+        self.layout.addWidget(self.node_browser, 0, 0)
+
         # 2. Graph Editor
         self.scene = GraphScene()
         self.manager = GraphManager(self.scene, self.project_model)
         self.view = GraphView(self.scene, self.manager)
-        self.layout.addWidget(self.view, 4, 0, 6, 6)
-        
+        self.layout.addWidget(self.view, 1, 0, 2, 1)
+
         # 3. Viz Panel
         self.viz_panel = VizPanel()
-        self.layout.addWidget(self.viz_panel, 0, 6, 6, 10)
-        
-        # 4. Context Panel
-        self.context_panel = ContextPanel() 
-        self.context_panel.setStyleSheet("background-color: #2A2A2A; color: #EEE;")
-        self.layout.addWidget(self.context_panel, 6, 6, 4, 10)
+        self.layout.addWidget(self.viz_panel, 0, 1, 2, 1)
+
+        # 4. Context Panel (styled by the application sheet; a hardcoded
+        # per-widget sheet here would shadow the light theme)
+        self.context_panel = ContextPanel()
+        self.layout.addWidget(self.context_panel, 2, 1)
 
         # --- Connections ---
         # Node Selection -> Update Context Panel
@@ -100,8 +218,314 @@ class MainWindow(QMainWindow):
         self.manager.computation_started.connect(self.status_bar.showMessage)
         
         # Computation Result -> Viz Panel
-        # Note: We connect the RESULT directly to the viz panel
-        self.manager.computation_finished.connect(lambda res: self.viz_panel.update_visualization(self.manager.current_worker.node, res))
+        # Direct bound-slot connection: the manager emits (node, result), so
+        # no lambda frame sits between the signal and the panel.
+        self.manager.computation_finished.connect(self.viz_panel.update_visualization)
+
+        # --- Project File State ---
+        self.current_project_path = None
+        self._io_busy = False   # Guards against overlapping load/save tasks
+        self._io_task = None    # Keeps the running task (and signals) alive
+
+        # Validation: one reusable validator plus the set of node ids edited
+        # since the last run, so re-validation only touches dirty nodes.
+        self._validator = GraphValidator()
+        self._validate_task = None
+        self._dirty_nodes = set()
+        self.manager.graph_dirty.connect(self._on_graph_dirty)
+
+        self.theme_manager = ThemeManager()
+
+        self._create_menus()
+
+        self.toolbar = PersistToolBar(self.actions_registry, self)
+        self.addToolBar(self.toolbar)
+        self.theme_manager.theme_changed.connect(
+            self.toolbar.set_theme, type=Qt.ConnectionType.DirectConnection)
+        self.toolbar.set_theme(self.theme_manager.current_theme)
+
+        # Apply the saved theme once the widget tree exists.
+        self.theme_manager.apply()
+
+    # --- Menus ---
+
+    def _create_menus(self):
+        """Creates the top-level menus; their actions are built lazily.
+
+        Only the four empty QMenus exist at startup. Each one is populated
+        by its builder on first aboutToShow, keeping QAction allocation and
+        signal wiring off the critical startup path.
+        """
+        bar = self.menuBar()
+        self._menu_builders = {}
+        for title, builder in (("&File", self._build_file_menu),
+                               ("&Edit", self._build_edit_menu),
+                               ("&View", self._build_view_menu),
+                               ("&Help", self._build_help_menu)):
+            menu = bar.addMenu(title)
+            self._menu_builders[menu] = builder
+            menu.aboutToShow.connect(self._populate_menu)
+
+        # One shared QAction per command, attached to both the menus and
+        # the toolbar; shortcuts dispatch through QShortcutMap with no menu
+        # realization required.
+        self.actions_registry = ActionRegistry(self)
+        for action, slot in (
+                (self.actions_registry.new_project, self._new_project),
+                (self.actions_registry.open_project, self._open_project),
+                (self.actions_registry.save_project, self._save_project),
+                (self.actions_registry.save_project_as,
+                 self._save_project_as),
+                (self.actions_registry.select_all, self._select_all),
+                (self.actions_registry.validate_graph, self._validate_graph),
+                (self.actions_registry.zoom_to_fit, self.view.zoom_to_fit),
+                (self.actions_registry.toggle_theme,
+                 self.theme_manager.toggle),
+                (self.actions_registry.about, self._show_about)):
+            # UI-thread to UI-thread: direct dispatch, no affinity check.
+            action.triggered.connect(
+                slot, type=Qt.ConnectionType.DirectConnection)
+
+    @pyqtSlot()
+    def _populate_menu(self):
+        """One-shot aboutToShow slot: builds the menu, then detaches."""
+        menu = self.sender()
+        builder = self._menu_builders.pop(menu, None)
+        if builder is None:
+            return
+        menu.aboutToShow.disconnect(self._populate_menu)
+        builder(menu)
+
+    def _build_file_menu(self, menu):
+        menu.addAction(self.actions_registry.new_project)
+        menu.addAction(self.actions_registry.open_project)
+        menu.addSeparator()
+        menu.addAction(self.actions_registry.save_project)
+        menu.addAction(self.actions_registry.save_project_as)
+
+    def _build_edit_menu(self, menu):
+        menu.addAction(self.actions_registry.select_all)
+        menu.addAction(self.actions_registry.validate_graph)
+
+    def _build_view_menu(self, menu):
+        menu.addAction(self.actions_registry.zoom_to_fit)
+        menu.addAction(self.actions_registry.toggle_theme)
+
+    def _build_help_menu(self, menu):
+        menu.addAction(self.actions_registry.about)
+
+    def _show_about(self):
+        # get_app_version is imported at module scope and lru-cached, so
+        # this callback never touches package metadata after the first call
+        QMessageBox.about(
+            self, "About Persistra",
+            f"Persistra {get_app_version()}\n"
+            "An experimental node-based visual analysis tool.")
+
+    def _select_all(self):
+        """Selects every item in one Qt-side bulk call."""
+        # A single setSelectionArea over the scene rect replaces N Python
+        # setSelected calls (and N selectionChanged emissions) with one
+        # C++ pass over the BSP index.
+        path = QPainterPath()
+        path.addRect(self.scene.sceneRect())
+        self.scene.blockSignals(True)
+        self.scene.setSelectionArea(
+            path,
+            Qt.ItemSelectionOperation.ReplaceSelection,
+            Qt.ItemSelectionMode.IntersectsItemShape)
+        self.scene.blockSignals(False)
+        self.scene.selectionChanged.emit()
+
+    # --- Project Lifecycle ---
+
+    def _clear_scene(self):
+        """Removes all items and the manager's view-model bookkeeping.
+
+        Callers are expected to hold the scene in NoIndex mode: clearing an
+        indexed scene removes items one by one with an index update each.
+        """
+        self.scene.clear()
+        self.manager.node_map.clear()
+        self.manager.wire_map.clear()
+        self.manager.invalidate_bounds()
+
+    def _new_project(self):
+        """Clears the scene and starts an empty project."""
+        # New on an already-fresh project is a no-op; skip the scene clear
+        # and panel resets entirely.
+        if not self.manager.node_map and self.current_project_path is None:
+            return
+        self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+        try:
+            self._clear_scene()
+        finally:
+            self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.BspTreeIndex)
+        self.project_model = Project()
+        self.manager.project = self.project_model
+        self.current_project_path = None
+        # Dirty ids belong to the discarded project; an empty set makes
+        # the next validation fall back to a full run.
+        self._dirty_nodes.clear()
+        self.context_panel.set_node(None)
+        self.viz_panel.reset_views()
+
+    def _open_project(self):
+        filepath, _ = QFileDialog.getOpenFileName(
+            self, "Open Project", "", "Persistra Project (*.persistra)")
+        if filepath:
+            self._open_project_path(filepath)
+
+    def _open_project_path(self, filepath):
+        """Loads a project file off-thread, then rebuilds the scene."""
+        if self._io_busy:
+            return
+        self._io_busy = True
+        # Normalize to a Path once; everything downstream reuses it
+        path = Path(filepath)
+        self.status_bar.showMessage(f"Opening {path}...")
+
+        task = _IOTask(load_project, str(path))
+        task.signals.finished.connect(
+            lambda project: self._on_project_loaded(project, path))
+        task.signals.error.connect(self._on_io_error)
+        self._io_task = task
+        QThreadPool.globalInstance().start(task)
+
+    def _on_project_loaded(self, project, filepath):
+        """Wires the loaded model into the scene (fast, UI-thread only)."""
+        self._io_busy = False
+        self.context_panel.set_node(None)
+        self.viz_panel.reset_views()
+        self.project_model = project
+        self.manager.project = project
+        # Stale dirty ids from the previous project would filter the new
+        # graph down to nothing; clear so the first run validates fully.
+        self._dirty_nodes.clear()
+
+        # One NoIndex window covers both the clear of the old scene and the
+        # bulk insert of the new one: every removeItem/addItem would
+        # otherwise rebuild the BSP index incrementally (O(N log N) over the
+        # load). Build the index and emit change signals once at the end.
+        self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+        self.scene.blockSignals(True)
+        # Freeze view painting as well: without this every addItem schedules
+        # a viewport repaint, so a load painted N times instead of once.
+        self.view.setUpdatesEnabled(False)
+        try:
+            self._clear_scene()
+            # 1. Recreate node items (NodeItem.__init__ already applies the
+            #    device-coordinate cache hint, so bulk-loaded nodes get it too)
+            node_items = [NodeItem(node_model) for node_model in project.nodes]
+            socket_items = {}  # {model socket id: SocketItem}
+            for node_item, node_model in zip(node_items, project.nodes):
+                node_item.setPos(*node_model.position)
+                self.scene.addItem(node_item)
+
+                for sock, item in zip(node_model.input_sockets, node_item.inputs):
+                    socket_items[sock.id] = item
+                for sock, item in zip(node_model.output_sockets, node_item.outputs):
+                    socket_items[sock.id] = item
+
+            # Build the item->model map in one allocation at its final size
+            # instead of growing (and rehashing) the dict per insert.
+            self.manager.node_map = dict(zip(node_items, project.nodes))
+
+            # 2. Recreate wires from the model's socket connections
+            for node_model in project.nodes:
+                for out_sock in node_model.output_sockets:
+                    for in_sock in out_sock.connections:
+                        wire_item = WireItem(socket_items[out_sock.id],
+                                             socket_items[in_sock.id])
+                        self.scene.addItem(wire_item)
+                        self.manager.wire_map[wire_item] = (node_model, in_sock.node)
+        finally:
+            self.scene.blockSignals(False)
+            self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.BspTreeIndex)
+            self.view.setUpdatesEnabled(True)
+            self.view.viewport().update()
+        self.manager.invalidate_bounds()
+
+        self.current_project_path = filepath
+        self.status_bar.showMessage(f"Opened {filepath}")
+
+    def _save_project(self):
+        if self.current_project_path:
+            self._do_save(self.current_project_path)
+        else:
+            self._save_project_as()
+
+    def _save_project_as(self):
+        filepath, _ = QFileDialog.getSaveFileName(
+            self, "Save Project", "", "Persistra Project (*.persistra)")
+        if filepath:
+            # One PurePath walk to enforce the extension
+            path = Path(filepath)
+            if path.suffix != ".persistra":
+                path = path.with_suffix(".persistra")
+            self._do_save(path)
+
+    def _do_save(self, filepath):
+        """Serializes the project off-thread so the UI stays responsive."""
+        if self._io_busy:
+            return
+        self._io_busy = True
+        self.status_bar.showMessage(f"Saving {filepath}...")
+
+        # One worker task covers the project write and the recent-list
+        # bookkeeping, so the UI thread never touches disk on save.
+        def _save_and_record(project=self.project_model, path=str(filepath)):
+            save_project(project, path)
+            commit_save(path)
+
+        task = _IOTask(_save_and_record)
+        task.signals.finished.connect(lambda _: self._on_project_saved(filepath))
+        task.signals.error.connect(self._on_io_error)
+        self._io_task = task
+        QThreadPool.globalInstance().start(task)
+
+    def _on_project_saved(self, filepath):
+        self._io_busy = False
+        self.current_project_path = filepath
+        self.status_bar.showMessage(f"Saved {filepath}")
+
+    @pyqtSlot(str)
+    def _on_io_error(self, message):
+        self._io_busy = False
+        self.status_bar.showMessage(f"File error: {message}")
+
+    # --- Validation ---
+
+    @pyqtSlot(object)
+    def _on_graph_dirty(self, node_ids):
+        self._dirty_nodes.update(node_ids)
+
+    def _validate_graph(self):
+        """Validates edited nodes on a worker thread."""
+        # Empty dirty set means nothing was edited since the last full run;
+        # pass None to validate the whole graph (e.g. right after a load).
+        dirty = set(self._dirty_nodes) or None
+        task = _IOTask(self._validator.validate, self.project_model, dirty)
+        task.signals.finished.connect(self._on_validation_finished)
+        task.signals.error.connect(self._on_io_error)
+        self._validate_task = task
+        QThreadPool.globalInstance().start(task)
+
+    def _on_validation_finished(self, messages):
+        self._dirty_nodes.clear()
+        # Single pass: log and classify each message once instead of
+        # re-walking the list per severity level.
+        errors, warnings = [], []
+        log_fns = {"error": logger.error, "warning": logger.warning}
+        for msg in messages:
+            log_fns.get(msg.level, logger.info)(
+                f"[{msg.level.upper()}] {msg.message}")
+            if msg.level == "error":
+                errors.append(msg)
+            elif msg.level == "warning":
+                warnings.append(msg)
+        self.status_bar.showMessage(
+            f"Validation: {len(errors)} error(s), {len(warnings)} warning(s)")
 
 if __name__ == "__main__":
     from PyQt6.QtWidgets import QApplication
@@ -0,0 +1,265 @@
+"""
+src/persistra/ui/theme/__init__.py
+
+Application theming. ThemeManager owns the active theme, applies QSS
+globally and notifies custom-painted widgets via theme_changed.
+"""
+import functools
+import json
+import os
+import time
+from pathlib import Path
+from sys import intern
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import QApplication
+
+from persistra.ui.theme.tokens import ThemeTokens
+from persistra.ui.theme.dark_modern import DARK_MODERN
+from persistra.ui.theme.light_modern import LIGHT_MODERN
+from persistra.ui.theme.stylesheets import (generate_component_qss,
+                                            generate_stylesheet)
+
+THEMES = {
+    "dark": DARK_MODERN,
+    "light": LIGHT_MODERN,
+}
+
+# Tokens are module-level constants, so the generated stylesheets are
+# constants too: partially evaluate both at import and make apply() a
+# dict lookup. generate_stylesheet only runs again for themes registered
+# dynamically at runtime.
+THEMES_QSS = {name: generate_stylesheet(tokens)
+              for name, tokens in THEMES.items()}
+
+# Operation category -> token field holding its header color. Names are
+# interned: categories with spaces are not auto-interned by CPython, and
+# interned keys make the per-paint get_category_color lookup a pointer
+# compare (the registry interns op.category on its side to match).
+# Both spellings in use are keyed: operations declare e.g. "Input" /
+# "Transformation" (io.py, tda.py) while the registry groups them under
+# "Input / Output" / "Transformation"; the remaining names come from the
+# planned category set (IMPROVEMENT-PLAN.md Section 5).
+_CATEGORY_FIELDS = tuple(
+    (intern(name), field) for name, field in (
+        ("Input", "category_io"),
+        ("Input / Output", "category_io"),
+        ("Transformation", "category_preprocessing"),
+        ("Preprocessing", "category_preprocessing"),
+        ("TDA", "category_tda"),
+        ("Machine Learning", "category_ml"),
+        ("Visualization", "category_viz"),
+        ("Utility", "category_utility"),
+        ("Templates", "category_templates"),
+        ("Plugins", "category_plugins"),
+    ))
+
+
+# Minimum spacing between accepted toggle() calls (seconds). Each toggle
+# costs a full setStyleSheet polish pass plus a settings write, so bursts
+# from key auto-repeat collapse to the first call.
+_TOGGLE_THROTTLE_S = 0.1
+
+
+def _settings_file() -> Path:
+    home = os.environ.get("PERSISTRA_HOME", Path.home() / ".persistra")
+    return Path(home) / "settings.json"
+
+
+def _theme_file() -> Path:
+    # One-line fast path ("dark"/"light") read at startup; settings.json
+    # stays the canonical store and is only parsed when actually needed.
+    return _settings_file().with_name("theme")
+
+
+@functools.lru_cache(maxsize=128)
+def hex_to_qcolor(value: str) -> QColor:
+    """Parse a hex color token into a QColor, memoized.
+
+    Paint code calls this per item per frame with interned token strings,
+    so repeated repaints of one theme never re-parse the same literal.
+    """
+    return QColor(value)
+
+
+class ThemeManager(QObject):
+    """
+    Singleton manager for application theming.
+    Emits `theme_changed` when the theme is toggled so that custom-painted
+    widgets (e.g. NodeItem, GraphScene) can refresh their colors.
+    """
+    theme_changed = pyqtSignal(str)  # Emits the new theme name
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        # __dict__ lookup, not hasattr: PyQt6 forbids attribute access on a
+        # QObject whose C++ side has not been initialized yet.
+        if "_initialized" in self.__dict__:
+            return
+        super().__init__()
+        self._initialized = True
+        self._settings = None  # parsed lazily; see _get_settings
+        self.current_theme = self._load_preference()
+        self.current_tokens: ThemeTokens = THEMES[self.current_theme]
+        self._category_map = self._build_category_map()
+        self._component_qss_cache = {}  # keyed by (theme name, component)
+        self._last_toggle = float("-inf")
+        # Deferred-apply state: multiple apply() calls within one event-loop
+        # tick collapse into a single setStyleSheet.
+        self._apply_pending = False
+        self._pending_qss = None
+        self._app = None  # QApplication.instance(), resolved on first apply
+
+    def apply(self):
+        """Apply the current theme's stylesheet to the entire application.
+
+        The actual setStyleSheet — a full style parse plus widget-tree
+        polish — is posted to the end of the current event-loop tick, so
+        several apply() requests in one tick cost a single polish pass.
+        """
+        if self._app is None:
+            self._app = QApplication.instance()
+            if self._app is None:
+                return
+        stylesheet = THEMES_QSS.get(self.current_theme)
+        if stylesheet is None:
+            stylesheet = generate_stylesheet(self.current_tokens)
+            THEMES_QSS[self.current_theme] = stylesheet
+        # Redundant applies are free: a no-op setStyleSheet still forces a
+        # full repolish, so skip scheduling when nothing would change.
+        if self._pending_qss is None and self._app.styleSheet() == stylesheet:
+            return
+        self._pending_qss = stylesheet
+        if not self._apply_pending:
+            self._apply_pending = True
+            QTimer.singleShot(0, self._flush_apply)
+
+    @pyqtSlot()
+    def _flush_apply(self):
+        self._apply_pending = False
+        if self._pending_qss is not None:
+            if self._app.styleSheet() != self._pending_qss:
+                self._app.setStyleSheet(self._pending_qss)
+            self._pending_qss = None
+
+    @pyqtSlot()
+    def toggle(self):
+        """Switch between dark and light themes (leading-edge throttled)."""
+        now = time.monotonic()
+        if now - self._last_toggle < _TOGGLE_THROTTLE_S:
+            return
+        self._last_toggle = now
+        self.set_theme("light" if self.current_theme == "dark" else "dark")
+
+    def set_theme(self, name: str):
+        """Activate the named theme.
+
+        No-ops when the theme is already active or unknown, so none of the
+        paint-heavy theme_changed subscribers are dispatched needlessly.
+        """
+        if name == self.current_theme or name not in THEMES:
+            return
+        self.current_theme = name
+        self.current_tokens = THEMES[name]
+        self._category_map = self._build_category_map()
+        self.apply()
+        self._save_preference()
+        self.theme_changed.emit(name)
+
+    def get_component_qss(self, component: str) -> str:
+        """Stylesheet for one item-view component ("tree"/"list"/"table").
+
+        Widgets apply these locally at construction so the global sheet
+        stays free of item-view selectors that Qt would otherwise match
+        against every widget during a polish pass.
+        """
+        key = (self.current_theme, component)
+        qss = self._component_qss_cache.get(key)
+        if qss is None:
+            qss = generate_component_qss(self.current_tokens, component)
+            self._component_qss_cache[key] = qss
+        return qss
+
+    def _build_category_map(self) -> dict:
+        """Category color lookup table, rebuilt only on theme change."""
+        tokens = self.current_tokens
+        return {name: getattr(tokens, field)
+                for name, field in _CATEGORY_FIELDS}
+
+    def get_category_color(self, category: str) -> str:
+        """Return the header color for a given operation category.
+
+        Called per node during repaints, so this is a plain dict lookup
+        against a table rebuilt once per toggle.
+        """
+        return self._category_map.get(
+            category, self.current_tokens.category_utility)
+
+    def _load_preference(self) -> str:
+        """Resolve the saved theme without touching the JSON parser.
+
+        The one-line theme file keeps startup off the json.loads path;
+        settings.json is only consulted when that file is missing.
+        """
+        try:
+            theme = _theme_file().read_text().strip()
+            if theme in THEMES:
+                return theme
+        except OSError:
+            pass
+        theme = self._get_settings().get("theme", "dark")
+        return theme if theme in THEMES else "dark"
+
+    def _get_settings(self) -> dict:
+        """Parse the settings file at most once; the dict lives in memory.
+
+        A single open attempt, no stat beforehand: a missing file and a
+        malformed one are distinct failure modes handled separately.
+        """
+        if self._settings is None:
+            try:
+                data = _settings_file().read_text()
+            except OSError:
+                settings = {}
+            else:
+                try:
+                    settings = json.loads(data)
+                except json.JSONDecodeError:
+                    settings = {}
+            self._settings = settings if isinstance(settings, dict) else {}
+        return self._settings
+
+    def _save_preference(self):
+        """Persist theme preference with an atomic replace.
+
+        The in-memory settings dict is authoritative, so no re-read is
+        needed; the temp-file + os.replace dance means a crash mid-write
+        leaves the previous settings intact (same protocol as
+        persistra.core.recent).
+        """
+        settings = self._get_settings()
+        settings["theme"] = self.current_theme
+        path = _settings_file()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(settings, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+        except OSError:
+            pass
+        # Refresh the startup fast path; non-atomic is fine since the JSON
+        # store above remains the fallback.
+        try:
+            _theme_file().write_text(self.current_theme + "\n")
+        except OSError:
+            pass
@@ -0,0 +1,332 @@
+"""
+src/persistra/ui/theme/stylesheets.py
+
+QSS generation: takes a ThemeTokens instance and produces a complete
+stylesheet applied globally via QApplication.setStyleSheet().
+"""
+from persistra.ui.theme.tokens import ThemeTokens
+
+
+class _TokenMap:
+    """Read-only mapping view over a ThemeTokens for str.format_map."""
+    __slots__ = ("_tokens",)
+
+    def __init__(self, tokens: ThemeTokens):
+        self._tokens = tokens
+
+    def __getitem__(self, key):
+        return getattr(self._tokens, key)
+
+
+# Table styling lives outside the global sheet: its selectors would be
+# matched against every widget during an application-wide polish, but only
+# the viz table uses them; the view applies its sheet once at
+# construction instead. Tree and list rules moved into the global sheet
+# (objectName-scoped) so each instance skips the per-widget QSS parse.
+_COMPONENT_TEMPLATES = {
+    "table": """
+QTableView {{
+    background-color: {background_secondary};
+    alternate-background-color: {background_tertiary};
+    color: {foreground};
+    gridline-color: {border};
+    border: 1px solid {border};
+    selection-background-color: {accent};
+    selection-color: {accent_foreground};
+}}
+QHeaderView::section {{
+    background-color: {panel_header_background};
+    color: {panel_header_foreground};
+    border: 1px solid {border};
+    padding: 4px 8px;
+    font-weight: bold;
+}}
+""",
+}
+
+# Parsed and interned once at import time; generate_stylesheet only fills
+# in the token fields.
+_QSS_TEMPLATE = """
+/* === Global === */
+QWidget {{
+    background-color: {background};
+    color: {foreground};
+    font-family: "Segoe UI", "SF Pro", "Helvetica Neue", sans-serif;
+    font-size: 13px;
+}}
+
+/* === Main Window === */
+QMainWindow {{
+    background-color: {background};
+}}
+
+/* === Menu Bar === */
+QMenuBar {{
+    background-color: {toolbar_background};
+    color: {menu_text};
+    border-bottom: 1px solid {border};
+    padding: 2px;
+}}
+QMenuBar::item:selected {{
+    background-color: {menu_hover};
+}}
+QMenu {{
+    background-color: {menu_background};
+    color: {menu_text};
+    border: 1px solid {border};
+}}
+QMenu::item:selected {{
+    background-color: {menu_hover};
+}}
+QMenu::separator {{
+    height: 1px;
+    background: {border};
+    margin: 4px 8px;
+}}
+
+/* === Toolbar === */
+QToolBar {{
+    background-color: {toolbar_background};
+    border-bottom: 1px solid {border};
+    spacing: 4px;
+    padding: 2px;
+}}
+QToolBar::separator {{
+    width: 1px;
+    background: {toolbar_separator};
+    margin: 4px 2px;
+}}
+QToolButton {{
+    background-color: transparent;
+    border: 1px solid transparent;
+    border-radius: 4px;
+    padding: 4px;
+    color: {foreground};
+}}
+QToolButton:hover {{
+    background-color: {menu_hover};
+    border: 1px solid {border};
+}}
+QToolButton:pressed {{
+    background-color: {accent};
+    color: {accent_foreground};
+}}
+
+/* === Status Bar === */
+QStatusBar {{
+    background-color: {statusbar_background};
+    color: {statusbar_text};
+    border-top: 1px solid {border};
+}}
+
+/* === Tab Widget === */
+/* Property-scoped: only widgets opting in via setProperty("persistraTabs",
+   True) are matched, instead of every QTabBar in the tree. */
+QTabWidget[persistraTabs="true"]::pane {{
+    border: 1px solid {border};
+    background-color: {background_secondary};
+}}
+QTabBar[persistraTabs="true"]::tab {{
+    background-color: {viz_tab_inactive};
+    color: {foreground_secondary};
+    border: 1px solid {border};
+    padding: 6px 12px;
+    margin-right: 2px;
+}}
+QTabBar[persistraTabs="true"]::tab:selected {{
+    background-color: {background_secondary};
+    color: {foreground};
+    border-bottom: 2px solid {viz_tab_active};
+}}
+QTabBar[persistraTabs="true"]::tab:hover {{
+    background-color: {menu_hover};
+}}
+
+/* === Scroll Area === */
+QScrollArea {{
+    border: none;
+    background-color: transparent;
+}}
+
+/* === Scrollbar === */
+QScrollBar:vertical {{
+    background: {scrollbar_background};
+    width: 10px;
+    margin: 0px;
+}}
+QScrollBar::handle:vertical {{
+    background: {scrollbar_handle};
+    min-height: 30px;
+    border-radius: 5px;
+}}
+QScrollBar::handle:vertical:hover {{
+    background: {scrollbar_handle_hover};
+}}
+QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
+    height: 0px;
+}}
+QScrollBar:horizontal {{
+    background: {scrollbar_background};
+    height: 10px;
+    margin: 0px;
+}}
+QScrollBar::handle:horizontal {{
+    background: {scrollbar_handle};
+    min-width: 30px;
+    border-radius: 5px;
+}}
+QScrollBar::handle:horizontal:hover {{
+    background: {scrollbar_handle_hover};
+}}
+QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
+    width: 0px;
+}}
+
+/* === Input Widgets === */
+QLineEdit, QSpinBox, QDoubleSpinBox, QComboBox {{
+    background-color: {context_input_background};
+    color: {foreground};
+    border: 1px solid {context_input_border};
+    border-radius: 3px;
+    padding: 4px 6px;
+}}
+QLineEdit:focus, QSpinBox:focus, QDoubleSpinBox:focus, QComboBox:focus {{
+    border: 1px solid {border_focus};
+}}
+QComboBox::drop-down {{
+    border: none;
+    padding-right: 8px;
+}}
+QComboBox QAbstractItemView {{
+    background-color: {menu_background};
+    color: {menu_text};
+    selection-background-color: {menu_hover};
+    border: 1px solid {border};
+}}
+
+/* === Node Browser Tree === */
+/* objectName-scoped: parsed once with the application sheet instead of
+   once per widget instance, while still only matching the browser. */
+QTreeView#nodeBrowserTree {{
+    background-color: {browser_background};
+    alternate-background-color: {browser_alternate};
+    color: {browser_text};
+    border: 1px solid {border};
+    outline: none;
+}}
+QTreeView#nodeBrowserTree::item {{
+    padding: 4px 8px;
+}}
+QTreeView#nodeBrowserTree::item:selected {{
+    background-color: {browser_selected};
+    color: {foreground};
+}}
+QTreeView#nodeBrowserTree::item:hover {{
+    background-color: {browser_hover};
+}}
+QTreeView#nodeBrowserTree::branch {{
+    background-color: {browser_background};
+}}
+
+/* === Recent Projects List === */
+QListWidget#recentProjectsList {{
+    background-color: {browser_background};
+    alternate-background-color: {browser_alternate};
+    color: {browser_text};
+    border: 1px solid {border};
+}}
+QListWidget#recentProjectsList::item {{
+    padding: 6px 8px;
+}}
+QListWidget#recentProjectsList::item:selected {{
+    background-color: {browser_selected};
+}}
+QListWidget#recentProjectsList::item:hover {{
+    background-color: {browser_hover};
+}}
+
+/* === Plain Text Edit (Log) === */
+QPlainTextEdit[persistraLog="true"] {{
+    background-color: {log_background};
+    color: {foreground};
+    border: 1px solid {border};
+    font-family: "Cascadia Code", "Consolas", "Fira Code", monospace;
+    font-size: 12px;
+}}
+
+/* === Labels === */
+QLabel {{
+    background-color: transparent;
+    color: {foreground};
+}}
+
+/* === Push Button === */
+QPushButton {{
+    background-color: {accent};
+    color: {accent_foreground};
+    border: none;
+    border-radius: 4px;
+    padding: 6px 14px;
+    font-weight: bold;
+}}
+QPushButton:hover {{
+    background-color: {accent_hover};
+}}
+QPushButton:pressed {{
+    background-color: {accent};
+}}
+QPushButton:disabled {{
+    background-color: {background_tertiary};
+    color: {foreground_secondary};
+}}
+
+/* === Checkbox === */
+QCheckBox {{
+    color: {foreground};
+    spacing: 6px;
+}}
+QCheckBox::indicator {{
+    width: 16px;
+    height: 16px;
+    border: 1px solid {border};
+    border-radius: 3px;
+    background-color: {context_input_background};
+}}
+QCheckBox::indicator:checked {{
+    background-color: {accent};
+    border-color: {accent};
+}}
+
+/* === Splitter === */
+QSplitter::handle {{
+    background-color: {border};
+}}
+QSplitter::handle:horizontal {{
+    width: 2px;
+}}
+QSplitter::handle:vertical {{
+    height: 2px;
+}}
+
+/* === Tooltip === */
+QToolTip {{
+    background-color: {menu_background};
+    color: {menu_text};
+    border: 1px solid {border};
+    padding: 4px;
+}}
+"""
+
+
+def generate_stylesheet(tokens: ThemeTokens) -> str:
+    """Generate the application-wide QSS stylesheet from theme tokens."""
+    return _QSS_TEMPLATE.format_map(_TokenMap(tokens))
+
+
+def generate_component_qss(tokens: ThemeTokens, component: str) -> str:
+    """Generate the stylesheet for one item-view component.
+
+    Currently only "table"; tree and list styling is objectName-scoped
+    in the application sheet.
+    """
+    return _COMPONENT_TEMPLATES[component].format_map(_TokenMap(tokens))
@@ -1,9 +1,18 @@
-from .viz_panel import *
-from .context_panel import *
-from .node_browser import *
+from .viz_panel import VizPanel
+from .context_panel import ContextPanel
+from .node_browser import NodeBrowser
+from .toolbar import PersistToolBar
+from .log_view import LogView, QLogHandler
+from .recent_projects import RecentProjectsList
+from .point_cloud_view import PointCloudView
 
 __all__ = [
         "VizPanel",
         "ContextPanel",
         "NodeBrowser",
+        "PersistToolBar",
+        "LogView",
+        "QLogHandler",
+        "RecentProjectsList",
+        "PointCloudView",
         ]
@@ -1,7 +1,24 @@
-from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QFormLayout, QLabel, 
-                             QSpinBox, QDoubleSpinBox, QLineEdit, QComboBox, 
-                             QScrollArea)
-from PyQt6.QtCore import Qt
+import logging
+from collections import defaultdict
+from functools import partial
+
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QFormLayout, QLabel,
+                             QSpinBox, QDoubleSpinBox, QLineEdit, QComboBox,
+                             QCheckBox, QScrollArea)
+from PyQt6.QtCore import QSignalBlocker, Qt
+
+logger = logging.getLogger(__name__)
+
+# The real backend's Parameter classes, used as dispatch keys so widget
+# creation is a single dict lookup on type(param) instead of a chain of
+# class-name string compares. Guarded so mock backends (which only need
+# the name-keyed fallback) still import cleanly.
+try:
+    from persistra.core.objects import (IntParam, FloatParam, StringParam,
+                                        ChoiceParam, BoolParam)
+except ImportError:
+    IntParam = FloatParam = StringParam = ChoiceParam = BoolParam = None
+
 
 class ContextPanel(QWidget):
     """
@@ -10,7 +27,28 @@ class ContextPanel(QWidget):
     """
     def __init__(self, parent=None):
         super().__init__(parent)
-        
+
+        # Class-keyed widget factory table (built once, not per parameter).
+        # Falls back to class names when the backend classes are unavailable.
+        if IntParam is not None:
+            self._widget_factories = {
+                IntParam: self._build_int,
+                FloatParam: self._build_float,
+                StringParam: self._build_string,
+                ChoiceParam: self._build_choice,
+                BoolParam: self._build_bool,
+            }
+            self._factory_key = type
+        else:
+            self._widget_factories = {
+                "IntParam": self._build_int,
+                "FloatParam": self._build_float,
+                "StringParam": self._build_string,
+                "ChoiceParam": self._build_choice,
+                "BoolParam": self._build_bool,
+            }
+            self._factory_key = lambda param: param.__class__.__name__
+
         # Main Layout
         self.main_layout = QVBoxLayout(self)
         self.main_layout.setContentsMargins(0, 0, 0, 0)
@@ -38,94 +76,188 @@ class ContextPanel(QWidget):
         # Current Node Reference
         self.current_node = None
 
+        # Recycled parameter widgets, keyed by _pool_key. Users select
+        # many nodes of the same operation type in a session, so the
+        # widget shapes repeat and construction (a Python->C++ crossing
+        # per widget) amortizes to zero after warmup.
+        self._pool = defaultdict(list)
+
     def set_node(self, node):
         """
         Rebuilds the UI based on the node's parameters.
+
+        The form is populated on a fresh, unparented container and swapped
+        into the scroll area in one step, so Qt runs a single layout pass
+        per selection instead of one per removed and one per added row.
         """
         self.current_node = node
-        
-        # 1. Clear previous widgets
-        while self.form_layout.count():
-            item = self.form_layout.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.deleteLater()
-                
+
+        # 1. Retire the old form first so its widgets land in the pool
+        # before the new rows ask for them.
+        self.setUpdatesEnabled(False)
+        old = self.scroll_area.takeWidget()
+        if old is not None:
+            self._recycle(old)
+
+        # 2. Build the replacement form off-screen.
+        new_widget = QWidget()
+        new_layout = QFormLayout(new_widget)
+        new_layout.setContentsMargins(10, 10, 10, 10)
+        new_layout.setSpacing(10)
+
         if node is None:
-            self.header.setText("Context: No Selection")
-            return
+            self._set_header("Context: No Selection")
+        else:
+            # 3. Update Header
+            # In the real backend, node.operation is an object instance.
+            # _display_name is cached on the class at registry import;
+            # the getattr fallback covers unregistered/mock operations.
+            op_cls = type(node.operation)
+            op_name = getattr(op_cls, '_display_name', op_cls.__name__)
+            self._set_header(f"Context: {op_name}")
 
-        # 2. Update Header
-        # In the real backend, node.operation is an object instance
-        op_name = node.operation.__class__.__name__
-        self.header.setText(f"Context: {op_name}")
-        
-        # 3. Build Widgets via Factory Pattern
-        # FIX: Iterate directly over 'node.parameters' (List[Parameter])
-        # In the real backend, 'node.parameters' is a list of Parameter objects, not a dict.
-        for param in node.parameters:
-            # The value is stored in the 'value' attribute of the Parameter object.
-            # If 'value' is not set, fall back to 'default'.
-            current_val = getattr(param, 'value', param.default)
-            
-            widget = self._create_widget_for_param(param, current_val)
-            if widget:
-                label = QLabel(param.name)
-                # Tooltip for description if available
-                if hasattr(param, 'description'):
-                    label.setToolTip(param.description)
-                    
-                self.form_layout.addRow(label, widget)
+            # 4. Build Widgets via Factory Pattern
+            # FIX: Iterate directly over 'node.parameters' (List[Parameter])
+            # In the real backend, 'node.parameters' is a list of Parameter objects, not a dict.
+            for param in node.parameters:
+                # The value is stored in the 'value' attribute of the Parameter object.
+                # If 'value' is not set, fall back to 'default'.
+                current_val = getattr(param, 'value', param.default)
+
+                widget = self._create_widget_for_param(param, current_val)
+                if widget:
+                    label = QLabel(param.name)
+                    # Tooltip for description if available
+                    if hasattr(param, 'description'):
+                        label.setToolTip(param.description)
+
+                    new_layout.addRow(label, widget)
+
+        # 5. Swap the container in a single repaint.
+        self.scroll_area.setWidget(new_widget)
+        self.form_widget = new_widget
+        self.form_layout = new_layout
+        self.setUpdatesEnabled(True)
+
+    def _set_header(self, text):
+        # setText repaints even for identical text; selection storms
+        # (rubber-band over nodes of one type) hit this per event
+        if text != self.header.text():
+            self.header.setText(text)
+
+    _POOL_LIMIT = 16  # Per key; beyond this widgets are just destroyed
+
+    # Change signal to detach when recycling, per pooled widget type
+    _CHANGE_SIGNALS = {
+        QSpinBox: "valueChanged",
+        QDoubleSpinBox: "valueChanged",
+        QLineEdit: "textChanged",
+        QComboBox: "currentTextChanged",
+        QCheckBox: "toggled",
+    }
+
+    @staticmethod
+    def _pool_key(widget):
+        cls = type(widget)
+        if cls is QComboBox:
+            # Combos are only interchangeable with identical option lists
+            return (cls, tuple(widget.itemText(i)
+                               for i in range(widget.count())))
+        if cls in (QSpinBox, QDoubleSpinBox, QLineEdit, QCheckBox):
+            return cls
+        return None  # Labels and anything else are not pooled
+
+    def _recycle(self, container):
+        """Harvests reusable parameter widgets before dropping the form."""
+        layout = container.layout()
+        if layout is not None:
+            while layout.count():
+                widget = layout.takeAt(0).widget()
+                if widget is None:
+                    continue
+                key = self._pool_key(widget)
+                pool = self._pool[key] if key is not None else None
+                if pool is None or len(pool) >= self._POOL_LIMIT:
+                    widget.deleteLater()
+                    continue
+                try:
+                    # Drop the stale partial slot bound to the old node
+                    getattr(widget, self._CHANGE_SIGNALS[type(widget)]).disconnect()
+                except TypeError:
+                    pass
+                widget.setParent(None)
+                pool.append(widget)
+        container.deleteLater()
+
+    def _acquire(self, key):
+        pool = self._pool.get(key)
+        return pool.pop() if pool else None
 
     def _create_widget_for_param(self, param, value):
         """
-        Factory method to generate the correct QWidget based on parameter type.
+        Factory dispatch: one dict lookup on the parameter's type replaces
+        the old chain of class-name string comparisons.
         """
-        p_type = param.__class__.__name__
-        
-        # --- Integer Parameter ---
-        if p_type == "IntParam":
-            widget = QSpinBox()
+        factory = self._widget_factories.get(self._factory_key(param))
+        return factory(param, value) if factory else None
+
+    # Initial configuration happens under QSignalBlocker in every builder,
+    # so no change signal can reach the model while a widget is being
+    # populated, regardless of the connect/setValue ordering.
+
+    def _build_int(self, param, value):
+        widget = self._acquire(QSpinBox) or QSpinBox()
+        with QSignalBlocker(widget):
             # Use getattr to safely access attributes that might vary between Mock/Real backends
             widget.setRange(getattr(param, 'min_val', -9999), getattr(param, 'max_val', 9999))
             widget.setValue(int(value))
-            # Two-way binding
-            widget.valueChanged.connect(lambda v, n=param.name: self._on_param_changed(n, v))
-            return widget
+        # Two-way binding
+        widget.valueChanged.connect(partial(self._on_param_changed, param.name))
+        return widget
 
-        # --- Float Parameter ---
-        elif p_type == "FloatParam":
-            widget = QDoubleSpinBox()
+    def _build_float(self, param, value):
+        widget = self._acquire(QDoubleSpinBox) or QDoubleSpinBox()
+        with QSignalBlocker(widget):
             widget.setRange(getattr(param, 'min_val', -9999.0), getattr(param, 'max_val', 9999.0))
             widget.setSingleStep(0.1)
             widget.setValue(float(value))
-            widget.valueChanged.connect(lambda v, n=param.name: self._on_param_changed(n, v))
-            return widget
-
-        # --- Choice/Dropdown Parameter ---
-        elif p_type == "ChoiceParam":
-            widget = QComboBox()
-            choices = getattr(param, 'choices', [])
-            widget.addItems(choices)
+        widget.valueChanged.connect(partial(self._on_param_changed, param.name))
+        return widget
+
+    def _build_choice(self, param, value):
+        # The real backend stores the list as 'options'; mocks used 'choices'.
+        options = getattr(param, 'options', None) or getattr(param, 'choices', [])
+        pooled = self._acquire((QComboBox, tuple(options)))
+        widget = pooled or QComboBox()
+        with QSignalBlocker(widget):
+            if pooled is None:
+                widget.addItems(options)
             # Select current value
-            if value in choices:
+            if value in options:
                 widget.setCurrentText(value)
-            widget.currentTextChanged.connect(lambda v, n=param.name: self._on_param_changed(n, v))
-            return widget
+        widget.currentTextChanged.connect(partial(self._on_param_changed, param.name))
+        return widget
 
-        # --- String Parameter ---
-        elif p_type == "StringParam":
-            widget = QLineEdit()
+    def _build_string(self, param, value):
+        widget = self._acquire(QLineEdit) or QLineEdit()
+        with QSignalBlocker(widget):
             widget.setText(str(value))
-            widget.textChanged.connect(lambda v, n=param.name: self._on_param_changed(n, v))
-            return widget
-            
-        return None
+        widget.textChanged.connect(partial(self._on_param_changed, param.name))
+        return widget
+
+    def _build_bool(self, param, value):
+        widget = self._acquire(QCheckBox) or QCheckBox()
+        with QSignalBlocker(widget):
+            widget.setChecked(bool(value))
+        widget.toggled.connect(partial(self._on_param_changed, param.name))
+        return widget
 
     def _on_param_changed(self, param_name, new_value):
         """
         Callback to update the model when UI changes.
         """
         if self.current_node:
-            print(f"ContextPanel: Setting {param_name} -> {new_value}")
+            # debug, not print: stdout flushes per line under Qt and the
+            # message fires on every spinbox tick
+            logger.debug("Setting %s -> %s", param_name, new_value)
             self.current_node.set_parameter(param_name, new_value)
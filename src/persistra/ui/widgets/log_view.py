@@ -0,0 +1,201 @@
+"""
+src/persistra/ui/widgets/log_view.py
+
+The output log panel: a read-only text area fed by a logging.Handler
+that relays records to the GUI thread, with a per-node filter dropdown.
+Ref: IMPROVEMENT-PLAN.md Section 9
+"""
+import logging
+import re
+from bisect import insort
+from collections import deque
+
+from PyQt6.QtCore import Q_ARG, QMetaObject, Qt, QTimer, pyqtSlot
+from PyQt6.QtGui import QColor, QTextCharFormat, QTextCursor
+from PyQt6.QtWidgets import (QComboBox, QHBoxLayout, QLabel, QPlainTextEdit,
+                             QVBoxLayout, QWidget)
+
+from persistra.ui.theme import ThemeManager
+
+
+class QLogHandler(logging.Handler):
+    """
+    Bridges the stdlib logging machinery onto the GUI thread.
+
+    A plain Handler — no QObject base, so attaching one costs no C++
+    object or signal setup. emit() hands the raw LogRecord to the view
+    via a queued invokeMethod; the GUI thread formats it only after the
+    node filter has accepted it, so records filtered out never pay for
+    Formatter.format.
+    """
+
+    def __init__(self, log_view):
+        super().__init__()
+        self._log_view = log_view
+        self.setFormatter(logging.Formatter(
+            "%(asctime)s  %(levelname)-8s %(name)s: %(message)s",
+            datefmt="%H:%M:%S"))
+
+    def emit(self, record):
+        QMetaObject.invokeMethod(
+            self._log_view, "_append_record",
+            Qt.ConnectionType.QueuedConnection,
+            Q_ARG("PyQt_PyObject", record))
+
+
+class LogView(QWidget):
+    """
+    Scrolling log output with level coloring and node filtering.
+    """
+    ALL_NODES = "All Nodes"
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self.layout = QVBoxLayout(self)
+        self.layout.setContentsMargins(0, 0, 0, 0)
+
+        # Filter row
+        filter_row = QHBoxLayout()
+        filter_row.setContentsMargins(5, 5, 5, 0)
+        filter_row.addWidget(QLabel("Filter:"))
+        self.node_filter = QComboBox()
+        self.node_filter.addItem(self.ALL_NODES)
+        filter_row.addWidget(self.node_filter, stretch=1)
+
+        # Previous filter population, kept for delta updates in set_nodes
+        self._filter_names = set()
+        self._sorted_names = []
+
+        # Compiled once per filter change; C-level search beats a Python
+        # substring scan when the same needle runs over every record.
+        self._filter_pattern: re.Pattern | None = None
+        self.node_filter.currentTextChanged.connect(self._on_filter_changed)
+        self.layout.addLayout(filter_row)
+
+        # Log text area. The property opts this widget into the theme's
+        # log styling without a tree-wide QPlainTextEdit selector.
+        self.text_edit = QPlainTextEdit()
+        self.text_edit.setReadOnly(True)
+        self.text_edit.setMaximumBlockCount(5000)
+        self.text_edit.setProperty("persistraLog", True)
+        self.layout.addWidget(self.text_edit)
+
+        # Handler wiring. The handler invokes _append_record queued:
+        # producers may log from the worker thread, and the record must
+        # be appended on the GUI thread.
+        self.handler = QLogHandler(self)
+        logging.getLogger("persistra").addHandler(self.handler)
+
+        # Per-level text formats, built once per theme instead of one
+        # QTextCharFormat + QColor + token lookup per record.
+        self._rebuild_level_formats()
+        ThemeManager().theme_changed.connect(self._rebuild_level_formats)
+
+        # Burst coalescing: records queue up here and flush on one short
+        # timer tick, so 10k DEBUG lines cost a handful of document edits
+        # and one autoscroll instead of one each. The maxlen mirrors the
+        # block limit, cheaply dropping overflow before it is formatted.
+        self._pending: deque = deque(maxlen=self.text_edit.maximumBlockCount())
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(16)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._flush_pending)
+
+    def set_nodes(self, names):
+        """Updates the node filter from the current graph's node names.
+
+        Applies only the delta against the previous population — one
+        node added or renamed costs two combo-box edits, not a full
+        clear-and-rebuild. When the delta exceeds half the new set a
+        rebuild is cheaper and is used instead. Selection is preserved
+        either way (a removed selection falls back to "All Nodes").
+        """
+        new = set(names)
+        to_add = new - self._filter_names
+        to_remove = self._filter_names - new
+
+        if len(to_add) + len(to_remove) > len(new) / 2:
+            current = self.node_filter.currentText()
+            self.node_filter.clear()
+            self._sorted_names = sorted(new)
+            self.node_filter.addItem(self.ALL_NODES)
+            self.node_filter.addItems(self._sorted_names)
+            index = self.node_filter.findText(current)
+            if index >= 0:
+                self.node_filter.setCurrentIndex(index)
+        else:
+            if self.node_filter.currentText() in to_remove:
+                self.node_filter.setCurrentIndex(0)
+            for name in to_remove:
+                index = self.node_filter.findText(name)
+                if index > 0:
+                    self.node_filter.removeItem(index)
+                self._sorted_names.remove(name)
+            for name in sorted(to_add):
+                insort(self._sorted_names, name)
+                # +1 skips the fixed "All Nodes" entry at index 0
+                self.node_filter.insertItem(
+                    self._sorted_names.index(name) + 1, name)
+
+        self._filter_names = new
+
+    @pyqtSlot(str)
+    def _on_filter_changed(self, name):
+        self._filter_pattern = (
+            None if name == self.ALL_NODES or not name
+            else re.compile(re.escape(name)))
+
+    @pyqtSlot(object)
+    def _append_record(self, record):
+        # Filter on the bare message first: rejected records never pay
+        # for asctime/levelname formatting.
+        if (self._filter_pattern is not None
+                and not self._filter_pattern.search(record.getMessage())):
+            return
+
+        self._pending.append((self.handler.format(record), record.levelname))
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    @pyqtSlot()
+    def _flush_pending(self):
+        if not self._pending:
+            return
+
+        cursor = self.text_edit.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+
+        # One insertText per run of same-level records.
+        group = []
+        group_level = None
+        while self._pending:
+            message, level = self._pending.popleft()
+            if level != group_level and group:
+                self._insert_group(cursor, group, group_level)
+                group = []
+            group_level = level
+            group.append(message)
+        if group:
+            self._insert_group(cursor, group, group_level)
+
+        scrollbar = self.text_edit.verticalScrollBar()
+        scrollbar.setValue(scrollbar.maximum())
+
+    def _insert_group(self, cursor, messages, level_name):
+        fmt = self._level_formats.get(level_name, self._level_formats["INFO"])
+        cursor.insertText("\n".join(messages) + "\n", fmt)
+
+    @pyqtSlot()
+    def _rebuild_level_formats(self, *_args):
+        tokens = ThemeManager().current_tokens
+        formats = {}
+        for level, color in (("ERROR", tokens.log_error),
+                             ("CRITICAL", tokens.log_error),
+                             ("WARNING", tokens.log_warning),
+                             ("INFO", tokens.log_info),
+                             ("DEBUG", tokens.log_debug)):
+            fmt = QTextCharFormat()
+            fmt.setForeground(QColor(color))
+            formats[level] = fmt
+        self._level_formats = formats
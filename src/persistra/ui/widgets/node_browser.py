@@ -1,75 +1,254 @@
-from PyQt6.QtWidgets import QListWidget, QListWidgetItem, QAbstractItemView
-from PyQt6.QtCore import Qt, QMimeData
-from PyQt6.QtGui import QDrag, QPixmap, QPainter, QColor
+from PyQt6.QtWidgets import (QAbstractItemView, QLineEdit, QTreeView,
+                             QVBoxLayout, QWidget)
+from PyQt6.QtCore import (Qt, QAbstractItemModel, QModelIndex, QMimeData,
+                          QTimer)
 
-class NodeBrowser(QListWidget):
+from PyQt6.QtGui import QColor, QDrag, QPainter, QPixmap
+
+from persistra.ui.theme import ThemeManager
+
+# Drag ghost pixmaps, rendered once per (theme, operation name). The
+# visual only depends on the leaf text, so repeated drags of the same
+# operation skip the QPixmap + QPainter work entirely.
+_DRAG_PIXMAPS = {}
+
+
+def _drag_pixmap(text):
+    tokens = ThemeManager().current_tokens
+    key = (tokens.accent, text)
+    pixmap = _DRAG_PIXMAPS.get(key)
+    if pixmap is None:
+        pixmap = QPixmap(120, 30)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setBrush(QColor(tokens.accent))
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.drawRoundedRect(0, 0, 119, 29, 4, 4)
+        painter.setPen(QColor(tokens.accent_foreground))
+        painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, text)
+        painter.end()
+        _DRAG_PIXMAPS[key] = pixmap
+    return pixmap
+
+
+class _RegistryModel(QAbstractItemModel):
     """
-    Displays a list of available operations.
-    Allows users to drag items onto the GraphCanvas.
-    Ref: README.md Section 4.1
+    Two-level lazy model over the operations registry.
+
+    Category rows exist up front (cheap — one row per category); the
+    operation rows underneath are only materialized by fetchMore when a
+    category is first expanded, so startup cost and memory scale with the
+    number of categories rather than the full registry.
+
+    Filtering uses a flat search index of prebuilt lowercase haystacks
+    (name, description, category), built once on first use, so each
+    keystroke is a single `in` scan per operation with no per-item
+    `.lower()` calls or Qt round-trips.
+
+    Internal ids: 0 marks a category index, category_row + 1 marks a leaf.
     """
+
+    def __init__(self, registry, parent=None):
+        super().__init__(parent)
+        self._registry = registry
+        self._loaded = {}  # {category name: [operation names]}
+        self._search_index = None  # [(category, op name, lc haystack)]
+        # Visible rows: (category, names) where names is None for the
+        # unfiltered lazy view and an explicit match list when filtering.
+        self._visible = [(cat, None) for cat in registry.keys()]
+
+    # --- Structure ---
+
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column, 0)
+        return self.createIndex(row, column, parent.row() + 1)
+
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        internal = int(index.internalId())
+        if internal == 0:
+            return QModelIndex()
+        return self.createIndex(internal - 1, 0, 0)
+
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self._visible)
+        if int(parent.internalId()) != 0:
+            return 0  # Leaves have no children
+        names = self._visible[parent.row()][1]
+        return 0 if names is None else len(names)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def hasChildren(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return True
+        # Categories always show an expander, even before their rows load
+        return int(parent.internalId()) == 0
+
+    # --- Lazy population ---
+
+    def canFetchMore(self, parent):
+        if not (parent.isValid() and int(parent.internalId()) == 0):
+            return False
+        category, names = self._visible[parent.row()]
+        return names is None and category not in self._loaded
+
+    def fetchMore(self, parent):
+        if not self.canFetchMore(parent):
+            return
+        row = parent.row()
+        category = self._visible[row][0]
+        names = [op.name for op in self._registry[category]]
+        if names:
+            self.beginInsertRows(parent, 0, len(names) - 1)
+            self._loaded[category] = names
+            # Store the list on the visible row too: data()/rowCount()
+            # then index straight into it with no dict hash per call.
+            self._visible[row] = (category, names)
+            self.endInsertRows()
+        else:
+            self._loaded[category] = []
+            self._visible[row] = (category, [])
+
+    # --- Filtering ---
+
+    def set_filter(self, query):
+        """Shows only operations whose haystack contains the query."""
+        query = query.strip().lower()
+        self.beginResetModel()
+        if not query:
+            # Restore the lazy view, reusing already-fetched name lists
+            loaded_get = self._loaded.get
+            self._visible = [(cat, loaded_get(cat)) for cat in self._registry]
+        else:
+            if self._search_index is None:
+                self._search_index = [
+                    (cat, op.name,
+                     f"{op.name}\x00{getattr(op, 'description', '')}"
+                     f"\x00{cat}".lower())
+                    for cat, ops in self._registry.items() for op in ops]
+            matches = {}
+            setdefault = matches.setdefault  # Hoisted out of the scan loop
+            for category, name, haystack in self._search_index:
+                if query in haystack:
+                    setdefault(category, []).append(name)
+            self._visible = list(matches.items())
+        self.endResetModel()
+
+    # --- Data / drag ---
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        internal = int(index.internalId())
+        if internal == 0:
+            return self._visible[index.row()][0]
+        # Leaf rows only exist once their list is on the visible entry,
+        # so this is a plain list index — no dict lookup per cell.
+        return self._visible[internal - 1][1][index.row()]
+
+    def flags(self, index):
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.isValid() and int(index.internalId()) != 0:
+            flags |= Qt.ItemFlag.ItemIsDragEnabled
+        return flags
+
+    def mimeData(self, indexes):
+        mime = QMimeData()
+        if indexes:
+            # The canvas drop handler expects the operation name as text
+            mime.setText(self.data(indexes[0]))
+        return mime
+
+
+class _OperationTree(QTreeView):
+    """The tree itself; drag source for the canvas."""
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.setHeaderHidden(True)
         self.setDragEnabled(True)
         self.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
-        self.setAlternatingRowColors(True)
-        
-        # Styling to match dark theme
-        # FIX: Added 'alternate-background-color' to ensure readability on alternating rows
-        self.setStyleSheet("""
-            QListWidget {
-                background-color: #252526;
-                alternate-background-color: #2E2E2E; 
-                color: #DDD;
-                border: 1px solid #3E3E42;
-            }
-            QListWidget::item {
-                padding: 5px;
-            }
-            QListWidget::item:selected {
-                background-color: #37373D;
-                color: white;
-            }
-            QListWidget::item:hover {
-                background-color: #333333;
-            }
-        """)
-
-    def add_operation(self, name):
-        """Adds an operation name to the list."""
-        item = QListWidgetItem(name)
-        item.setFlags(Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsDragEnabled)
-        self.addItem(item)
-
-    def startDrag(self, supportedActions):
-        """
-        Custom drag event to package the operation name.
-        """
-        item = self.currentItem()
-        if not item:
+
+    def startDrag(self, supported_actions):
+        index = self.currentIndex()
+        if not index.isValid():
             return
-            
-        op_name = item.text()
-        
-        # 1. Create Mime Data (Standard Text)
-        mime_data = QMimeData()
-        mime_data.setText(op_name)
-        
-        # 2. Create Drag Object
+        mime = self.model().mimeData([index])
+        if not mime.text():
+            return  # Category rows don't drag
         drag = QDrag(self)
-        drag.setMimeData(mime_data)
-        
-        # 3. Create a visual pixmap for the drag cursor
-        pixmap = QPixmap(100, 30)
-        pixmap.fill(QColor("transparent"))
-        painter = QPainter(pixmap)
-        painter.setBrush(QColor("#444"))
-        painter.setPen(QColor("#FFF"))
-        painter.drawRect(0, 0, 99, 29)
-        painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, op_name)
-        painter.end()
-        
+        drag.setMimeData(mime)
+        pixmap = _drag_pixmap(mime.text())
         drag.setPixmap(pixmap)
         drag.setHotSpot(pixmap.rect().center())
-        
-        drag.exec(supportedActions)
+        drag.exec(Qt.DropAction.CopyAction)
+
+
+class NodeBrowser(QWidget):
+    """
+    Displays the available operations grouped by category, with a search
+    box that filters them. Allows users to drag leaf items onto the
+    GraphCanvas.
+    Ref: README.md Section 4.1
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self.layout = QVBoxLayout(self)
+        self.layout.setContentsMargins(0, 0, 0, 0)
+
+        self.search_bar = QLineEdit()
+        self.search_bar.setPlaceholderText("Search operations...")
+        self.search_bar.setClearButtonEnabled(True)
+        self.layout.addWidget(self.search_bar)
+
+        self.tree = _OperationTree()
+        # Styled by the objectName-scoped rules in the application sheet;
+        # no per-instance QSS parse on construction.
+        self.tree.setObjectName("nodeBrowserTree")
+        self.layout.addWidget(self.tree)
+
+        # Debounced: the filter only runs after a typing pause, so a
+        # 20-character query costs one scan instead of twenty. Clearing
+        # the box filters immediately — an empty query is cheap and the
+        # user expects the full tree back at once.
+        self._search_debounce = QTimer(self)
+        self._search_debounce.setSingleShot(True)
+        self._search_debounce.setInterval(100)
+        self._search_debounce.timeout.connect(self._run_filter)
+        self.search_bar.textChanged.connect(self._on_search_text_changed)
+
+    def set_registry(self, registry):
+        """Points the browser at a registry. Constant time: the model only
+        enumerates categories here; operations load on first expand."""
+        self.tree.setModel(_RegistryModel(registry, self))
+
+    def _on_search_text_changed(self, text):
+        if not text:
+            self._search_debounce.stop()
+            self._run_filter()
+        else:
+            self._search_debounce.start()
+
+    def _run_filter(self):
+        self._filter_tree(self.search_bar.text())
+
+    def _filter_tree(self, text):
+        model = self.tree.model()
+        if model is None:
+            return
+        # One repaint for the reset + expand, not one per row change
+        self.tree.setUpdatesEnabled(False)
+        try:
+            model.set_filter(text)
+            if text.strip():
+                self.tree.expandAll()
+        finally:
+            self.tree.setUpdatesEnabled(True)
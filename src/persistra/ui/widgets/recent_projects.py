@@ -0,0 +1,136 @@
+"""
+src/persistra/ui/widgets/recent_projects.py
+
+List of recently-opened projects shown in the browser panel when no
+project is open. Entries come from persistra.core.recent; the per-entry
+stat calls run on the global thread pool so a stale or network-mounted
+path never blocks the UI thread.
+Ref: IMPROVEMENT-PLAN.md Section 5.5
+"""
+import os
+import time
+
+from PyQt6.QtCore import (QObject, QRunnable, QSize, QThreadPool, Qt,
+                          pyqtSignal, pyqtSlot)
+from PyQt6.QtWidgets import QListWidget, QListWidgetItem, QStyledItemDelegate
+
+from persistra.core.recent import load_recent_projects
+
+
+class _ScanSignals(QObject):
+    """Signal relay for _RecentScanRunnable (QRunnable cannot emit)."""
+    entry_ready = pyqtSignal(int, str, str, str)  # (epoch, name, path, mtime)
+
+
+class _RecentScanRunnable(QRunnable):
+    """Loads the recent list and stats each entry off the UI thread."""
+
+    def __init__(self, epoch, mtime_cache):
+        super().__init__()
+        self.epoch = epoch
+        self._mtime_cache = mtime_cache
+        self.signals = _ScanSignals()
+
+    def run(self):
+        # os.stat/time.strftime over pathlib/datetime: no Path object per
+        # entry, no tzinfo machinery — this loop is the whole worker.
+        for filepath in load_recent_projects():
+            try:
+                mtime_ts = os.stat(filepath).st_mtime
+            except OSError:
+                mtime_str = "unknown"
+            else:
+                # Re-format only when the file actually changed
+                cached = self._mtime_cache.get(filepath)
+                if cached is not None and cached[0] == mtime_ts:
+                    mtime_str = cached[1]
+                else:
+                    mtime_str = time.strftime(
+                        "%Y-%m-%d %H:%M", time.localtime(mtime_ts))
+                    self._mtime_cache[filepath] = (mtime_ts, mtime_str)
+            name = os.path.splitext(os.path.basename(filepath))[0]
+            self.signals.entry_ready.emit(self.epoch, name, filepath, mtime_str)
+
+
+_MTIME_ROLE = Qt.ItemDataRole.UserRole + 1
+
+
+class _RecentDelegate(QStyledItemDelegate):
+    """Draws name plus right-aligned mtime on one line.
+
+    Keeping the mtime out of the display text means Qt lays out a single
+    short string per item instead of measuring a multi-line blob on
+    every paint; the row height is computed once from font metrics.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._size_hint = None
+
+    def paint(self, painter, option, index):
+        # Base class draws background/selection and the name
+        super().paint(painter, option, index)
+        mtime = index.data(_MTIME_ROLE)
+        if mtime:
+            rect = option.rect.adjusted(8, 0, -8, 0)
+            painter.save()
+            painter.setPen(option.palette.placeholderText().color())
+            painter.drawText(
+                rect,
+                int(Qt.AlignmentFlag.AlignRight
+                    | Qt.AlignmentFlag.AlignVCenter),
+                mtime)
+            painter.restore()
+
+    def sizeHint(self, option, index):
+        if self._size_hint is None:
+            self._size_hint = QSize(
+                0, option.fontMetrics.height() + 12)
+        return self._size_hint
+
+
+class RecentProjectsList(QListWidget):
+    """
+    Recently-opened projects with name, path and last-modified date.
+    Activating an entry asks the window to open that project.
+    """
+    project_activated = pyqtSignal(str)  # Project file path
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setAlternatingRowColors(True)
+        # Styled by the objectName-scoped rules in the application sheet;
+        # no per-instance QSS parse on construction.
+        self.setObjectName("recentProjectsList")
+        self.setItemDelegate(_RecentDelegate(self))
+
+        self.itemActivated.connect(self._on_item_activated)
+
+        # Monotonic refresh epoch: entries from a superseded scan are
+        # dropped instead of interleaving with the newer one.
+        self._scan_epoch = 0
+        self._mtime_cache = {}  # {filepath: (st_mtime, formatted string)}
+
+    def refresh(self):
+        """Clears the list and repopulates it from a background scan."""
+        self._scan_epoch += 1
+        self.clear()
+        runnable = _RecentScanRunnable(self._scan_epoch, self._mtime_cache)
+        runnable.signals.entry_ready.connect(
+            self._add_entry, Qt.ConnectionType.QueuedConnection)
+        QThreadPool.globalInstance().start(runnable)
+
+    @pyqtSlot(int, str, str, str)
+    def _add_entry(self, epoch, name, filepath, mtime_str):
+        if epoch != self._scan_epoch:
+            return  # Stale scan
+        # Display text is just the name; path and mtime ride on roles so
+        # each item lays out one short single-line string
+        item = QListWidgetItem(name)
+        item.setToolTip(filepath)
+        item.setData(Qt.ItemDataRole.UserRole, filepath)
+        item.setData(_MTIME_ROLE, mtime_str)
+        self.addItem(item)
+
+    def _on_item_activated(self, item):
+        self.project_activated.emit(item.data(Qt.ItemDataRole.UserRole))
@@ -0,0 +1,35 @@
+"""
+src/persistra/ui/widgets/toolbar.py
+
+The main application toolbar. Attaches the shared QActions owned by the
+window's ActionRegistry; no parallel actions or relay signals.
+"""
+from PyQt6.QtCore import pyqtSlot
+from PyQt6.QtWidgets import QToolBar
+
+from persistra.ui.icons import bundled_icon
+
+
+class PersistToolBar(QToolBar):
+    """
+    Quick-access actions for the most common operations.
+    """
+
+    def __init__(self, actions, parent=None):
+        super().__init__("Main Toolbar", parent)
+        self.setMovable(False)
+
+        self._theme_action = actions.toggle_theme
+
+        self.addAction(actions.new_project)
+        self.addAction(actions.open_project)
+        self.addAction(actions.save_project)
+        self.addSeparator()
+        self.addAction(actions.zoom_to_fit)
+        self.addAction(actions.toggle_theme)
+
+    @pyqtSlot(str)
+    def set_theme(self, theme_name: str):
+        """Updates the theme-toggle icon for the active theme."""
+        icon_name = "theme_sun" if theme_name == "dark" else "theme_moon"
+        self._theme_action.setIcon(bundled_icon(icon_name))
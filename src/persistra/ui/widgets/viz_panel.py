@@ -2,39 +2,216 @@ import pandas as pd
 import numpy as np
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QTabWidget, QTableView, 
                              QLabel, QHeaderView)
-from PyQt6.QtCore import Qt, QAbstractTableModel
+from PyQt6.QtCore import (Qt, QAbstractTableModel, QModelIndex, QObject,
+                          QRunnable, QThreadPool, QTimer, pyqtSignal,
+                          pyqtSlot)
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
 from matplotlib.figure import Figure
+from persistra.core.objects import DataWrapper
+from persistra.ui.theme import ThemeManager
+from persistra.ui.widgets.log_view import LogView
 
-# --- Pandas Table Model ---
-class PandasModel(QAbstractTableModel):
+# Qt asks data() for ~10 roles per cell per repaint; bind the one we
+# answer as a module constant so the early-out is a single int compare
+# with no enum attribute chain.
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+# headerData compares orientations per visible section per repaint;
+# same treatment as the role above.
+_HORIZONTAL = Qt.Orientation.Horizontal
+_VERTICAL = Qt.Orientation.Vertical
+
+# Shared Generator for the mock renders: default_rng is both faster to
+# sample from than the legacy np.random.* functions and constructed once
+# instead of re-seeding global state per call.
+_RNG = np.random.default_rng()
+
+# --- Table Models ---
+class _WindowedTableModel(QAbstractTableModel):
+    """Shared fetchMore windowing for the table models below.
+
+    The view lays out (and width-probes) every reported row, so a
+    million-row source would stall on first display. Subclasses set
+    self._total; rows are exposed in a window that grows as the user
+    scrolls toward the end.
+    """
+    _INITIAL_ROWS = 200
+    _FETCH_STEP = 500
+
+    def __init__(self, total_rows):
+        super().__init__()
+        self._total = total_rows
+        self._loaded = min(total_rows, self._INITIAL_ROWS)
+
+    def rowCount(self, parent=None):
+        return self._loaded
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return self._loaded < self._total
+
+    def fetchMore(self, parent=QModelIndex()):
+        remaining = self._total - self._loaded
+        if remaining <= 0:
+            return
+        step = min(remaining, self._FETCH_STEP)
+        self.beginInsertRows(parent, self._loaded, self._loaded + step - 1)
+        self._loaded += step
+        self.endInsertRows()
+
+    def roleNames(self):
+        # Advertise only the role data() answers, so generic consumers
+        # (QML bridges, test probes) don't iterate the default dozen.
+        return {int(_DISPLAY_ROLE): b"display"}
+
+
+class PandasModel(_WindowedTableModel):
     """
     A custom model to interface between Pandas DataFrames and QTableView.
     Ref: README.md Section 4.3 (Viz Panel)
     """
     def __init__(self, data: pd.DataFrame):
-        super().__init__()
+        super().__init__(data.shape[0])
         self._data = data
-
-    def rowCount(self, parent=None):
-        return self._data.shape[0]
+        # Scrolling paints query data() per visible cell; going through
+        # pandas .iloc there costs a full indexer dispatch each time.
+        # Read from per-column ndarrays instead (zero-copy, and unlike a
+        # single to_numpy() this keeps each column's dtype so ints don't
+        # render as floats). Datetime/timedelta columns stay as Series:
+        # their ndarray astype(str) yields the ISO/nanosecond form, while
+        # the pandas conversion keeps the human '2023-01-01 00:00:00'
+        # rendering. Cells are stringified in 256-row chunks: a paint
+        # touching one new row materializes its whole chunk, so the
+        # following screens of scrolling are pure list indexing.
+        self._columns = [data[col] if data[col].dtype.kind in "mM"
+                         else data[col].to_numpy()
+                         for col in data.columns]
+        self._chunks = {}  # chunk id -> [per-column list of cell strings]
+        # Headers repaint on every scroll tick; stringify them once here
+        # (astype is a single vectorized pass over the index) instead of
+        # going through Index.__getitem__ + str() per visible section.
+        self._header_cols = data.columns.astype(str)
+        self._header_idx = data.index.astype(str)
 
     def columnCount(self, parent=None):
         return self._data.shape[1]
 
-    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
-        if index.isValid() and role == Qt.ItemDataRole.DisplayRole:
-            return str(self._data.iloc[index.row(), index.column()])
+    _CHUNK = 256  # Rows stringified per fault-in; must stay a power of 2
+
+    def data(self, index, role=_DISPLAY_ROLE):
+        # Reject the ~9 other roles first; the view never passes an
+        # invalid index here, so there is no isValid() round-trip.
+        if role != _DISPLAY_ROLE:
+            return None
+        row = index.row()
+        chunk = self._chunks.get(row // self._CHUNK)
+        if chunk is None:
+            chunk = self._ensure_chunk(row)
+        return chunk[index.column()][row % self._CHUNK]
+
+    def _ensure_chunk(self, row):
+        chunk_id = row // self._CHUNK
+        base = chunk_id * self._CHUNK
+        stop = min(base + self._CHUNK, self._total)
+        # astype(str) converts the whole slice in one C-level pass (it
+        # degrades to per-element str() only for object columns), and
+        # tolist() yields plain Python strings ready to hand to Qt.
+        # Series columns (datetimes) slice positionally via iloc.
+        chunk = [column.iloc[base:stop].astype(str).tolist()
+                 if isinstance(column, pd.Series)
+                 else column[base:stop].astype(str).tolist()
+                 for column in self._columns]
+        self._chunks[chunk_id] = chunk
+        return chunk
+
+    def headerData(self, section, orientation, role):
+        if role == _DISPLAY_ROLE:
+            if orientation == _HORIZONTAL:
+                return self._header_cols[section]
+            if orientation == _VERTICAL:
+                return self._header_idx[section]
         return None
 
+
+class NDArrayModel(_WindowedTableModel):
+    """Table model over a 2-D ndarray, no DataFrame detour.
+
+    np.asarray is a zero-copy view for ndarray input, so displaying an
+    array allocates nothing beyond the stringified cells actually
+    painted. Series are shown through this model too, via a reshaped
+    (also zero-copy) view of their values.
+    """
+    # printf-style format per dtype kind: np.char.mod renders a whole
+    # chunk in one C loop, and '%g' keeps float cells compact
+    _DTYPE_FORMATS = {"f": "%g", "i": "%d", "u": "%d"}
+
+    _CHUNK = 256
+
+    def __init__(self, array, columns=None):
+        array = np.asarray(array)
+        super().__init__(array.shape[0])
+        self._array = array
+        self._columns = columns  # Optional header labels (e.g. Series name)
+        self._format = self._DTYPE_FORMATS.get(array.dtype.kind)
+        self._chunks = {}  # chunk id -> list of row-string lists
+
+    def columnCount(self, parent=None):
+        return self._array.shape[1]
+
+    def data(self, index, role=_DISPLAY_ROLE):
+        if role != _DISPLAY_ROLE:
+            return None
+        row = index.row()
+        chunk = self._chunks.get(row // self._CHUNK)
+        if chunk is None:
+            chunk = self._ensure_chunk(row)
+        return chunk[row % self._CHUNK][index.column()]
+
+    def _ensure_chunk(self, row):
+        chunk_id = row // self._CHUNK
+        base = chunk_id * self._CHUNK
+        block = self._array[base:base + self._CHUNK]
+        if self._format is not None:
+            chunk = np.char.mod(self._format, block).tolist()
+        else:
+            chunk = block.astype(str).tolist()
+        self._chunks[chunk_id] = chunk
+        return chunk
+
     def headerData(self, section, orientation, role):
-        if role == Qt.ItemDataRole.DisplayRole:
-            if orientation == Qt.Orientation.Horizontal:
-                return str(self._data.columns[section])
-            if orientation == Qt.Orientation.Vertical:
-                return str(self._data.index[section])
+        if role == _DISPLAY_ROLE:
+            if orientation == _HORIZONTAL and self._columns is not None:
+                return str(self._columns[section])
+            return str(section)
         return None
 
+class _TableBuildSignals(QObject):
+    """Signal relay for _MockTableRunnable (QRunnable cannot emit)."""
+    finished = pyqtSignal(int, object)  # (generation, DataFrame)
+
+
+class _MockTableRunnable(QRunnable):
+    """Builds the mock table frame off the UI thread."""
+
+    def __init__(self, generation, op_type):
+        super().__init__()
+        self.generation = generation
+        self.op_type = op_type
+        self.signals = _TableBuildSignals()
+
+    def run(self):
+        if self.op_type == "CSVLoader":
+            data = pd.DataFrame({
+                'Date': pd.date_range(start='1/1/2023', periods=5),
+                'Price': _RNG.random(5) * 100,
+                'Volume': _RNG.integers(100, 1000, 5)
+            })
+        elif self.op_type == "SlidingWindow":
+            data = pd.DataFrame(_RNG.random((5, 4)),
+                                columns=['t-3', 't-2', 't-1', 't'])
+        else:
+            data = pd.DataFrame({'Info': ['No data available']})
+        self.signals.finished.emit(self.generation, data)
+
+
 # --- Main Viz Panel Widget ---
 class VizPanel(QWidget):
     """
@@ -47,33 +224,247 @@ class VizPanel(QWidget):
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(0, 0, 0, 0)
         
-        # Tabs for different view modes
+        # Tabs for different view modes. The property opts this widget into
+        # the theme's tab styling without a tree-wide QTabBar selector.
         self.tabs = QTabWidget()
+        self.tabs.setProperty("persistraTabs", True)
+        self.tabs.tabBar().setProperty("persistraTabs", True)
         self.layout.addWidget(self.tabs)
         
-        # Tab 1: Plot Viewer
+        # Tab 1: Plot Viewer. The Agg canvas is deferred: constructing
+        # it allocates a figure-sized render buffer and pays a
+        # Python->C++ widget crossing, which is wasted whenever a session
+        # never shows a plot. It is created on first access.
         self.plot_widget = QWidget()
         self.plot_layout = QVBoxLayout(self.plot_widget)
-        self.canvas = FigureCanvasQTAgg(Figure(figsize=(5, 3)))
-        self.plot_layout.addWidget(self.canvas)
+        self._canvas = None
         self.tabs.addTab(self.plot_widget, "Plot Viewer")
         
         # Tab 2: Table Viewer
         self.table_view = QTableView()
         self.table_view.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        # Bound the rows sampled when a column is resized to contents
+        # (double-click on a section edge); the default probes every
+        # fetched row.
+        self.table_view.horizontalHeader().setResizeContentsPrecision(50)
+        # All rows are single-line text: a fixed height skips the
+        # per-row sizeHintForRow probe entirely.
+        self.table_view.verticalHeader().setSectionResizeMode(
+            QHeaderView.ResizeMode.Fixed)
+        self.table_view.verticalHeader().setDefaultSectionSize(20)
         self.tabs.addTab(self.table_view, "Table Viewer")
+
+        # Tab 3: Output Log (Ref: IMPROVEMENT-PLAN.md Section 9)
+        self.log_view = LogView()
+        self.tabs.addTab(self.log_view, "Output Log")
+
+        # Table styling is scoped to this view rather than the global sheet.
+        theme = ThemeManager()
+        self.table_view.setStyleSheet(theme.get_component_qss("table"))
+        theme.theme_changed.connect(self._apply_theme)
         
         # Current Node Tracker
         self.current_node = None
+
+        # Output type -> route handler. Exact-type lookup first (the
+        # common case: operations emit plain Figure/DataFrame/ndarray),
+        # with an isinstance scan as the subclass fallback. Handlers
+        # return True when they displayed the value.
+        self._render_dispatch = {
+            Figure: self._route_figure,
+            pd.DataFrame: self._route_table,
+            pd.Series: self._route_series,
+            np.ndarray: self._route_ndarray,
+        }
+
+        # The object currently shown in the table tab. Re-selecting a
+        # node whose cached output is unchanged is an identity hit here,
+        # skipping a model rebuild (and the scroll-position reset that
+        # comes with it). Figures need no equivalent: _render_figure
+        # already short-circuits on the bound figure.
+        self._displayed_source = None
+
+        # Blit state: captured axes background + the artists redrawn on
+        # top of it (see prepare_for_blit/update_blit)
+        self._blit_background = None
+        self._blit_artists = []
+
+        # Results arriving in bursts (a chain of fast upstream nodes
+        # recomputing) are coalesced: only the last delivery within the
+        # window is actually rendered.
+        self._pending_update = None
+        self._update_debounce = QTimer(self)
+        self._update_debounce.setSingleShot(True)
+        self._update_debounce.setInterval(30)
+        self._update_debounce.timeout.connect(self._flush_update)
         
+        # Monotonic generation for background table builds: a result
+        # from a superseded selection is dropped instead of clobbering
+        # the newer one (same pattern as RecentProjectsList's scans).
+        self._table_generation = 0
+
         # Initial State: Show placeholder
         self.reset_views()
 
+    @property
+    def canvas(self):
+        """The plot canvas, constructed on first use."""
+        if self._canvas is None:
+            # Fixed dpi and no layout engine: matplotlib otherwise runs a
+            # tight-layout solver pass on every resize of the dock
+            self._canvas = FigureCanvasQTAgg(Figure(
+                figsize=(5, 3), dpi=96, layout=None))
+            self.plot_layout.addWidget(self._canvas)
+            # Any full draw (resize, dpi change, tab re-show) invalidates
+            # the captured blit background; recapture it right after so
+            # update_blit never restores a stale-geometry region.
+            self._canvas.mpl_connect("draw_event", self._on_full_draw)
+        return self._canvas
+
+    def _apply_theme(self, _theme_name):
+        self.table_view.setStyleSheet(ThemeManager().get_component_qss("table"))
+
     def reset_views(self):
-        """Clears current visualizations."""
-        self.canvas.figure.clear()
+        """Clears current visualizations (no-op when already empty)."""
+        if self._canvas is not None and self._canvas.figure.get_axes():
+            self._blit_background = None
+            self._blit_artists = []
+            self._canvas.figure.clear()
+            self._canvas.draw_idle()
+        if self.table_view.model() is not None:
+            self.table_view.setModel(None)
+            self._displayed_source = None
+
+    def update_visualization(self, node, result):
+        """
+        Displays the computed outputs of a node (debounced).
+        Direct slot for GraphManager.computation_finished.
+        """
+        self._pending_update = (node, result)
+        self._update_debounce.start()
+
+    @pyqtSlot()
+    def _flush_update(self):
+        if self._pending_update is None:
+            return
+        node, result = self._pending_update
+        self._pending_update = None
+        self._display_result(node, result)
+
+    def _display_result(self, node, result):
+        self.current_node = node
+
+        # Route on the first displayable output. The reset is deferred
+        # until the route is known so that re-rendering the currently
+        # bound figure does not clear it first.
+        if result:
+            for value in result.values():
+                data = value.data if isinstance(value, DataWrapper) else value
+                handler = self._render_dispatch.get(type(data))
+                if handler is None:
+                    for cls, candidate in self._render_dispatch.items():
+                        if isinstance(data, cls):
+                            handler = candidate
+                            break
+                if handler is not None and handler(data):
+                    return
+
+        self.reset_views()
+
+    def _route_figure(self, figure):
+        if self.table_view.model() is not None:
+            self.table_view.setModel(None)
+            self._displayed_source = None
+        self._render_figure(figure)
+        return True
+
+    def _route_table(self, df):
+        if df is self._displayed_source and self.table_view.model() is not None:
+            self.tabs.setCurrentIndex(1)
+            return True
+        self._render_table(df)
+        self._displayed_source = df
+        return True
+
+    def _route_ndarray(self, array):
+        if array.ndim != 2:
+            return False
+        if (array is self._displayed_source
+                and self.table_view.model() is not None):
+            self.tabs.setCurrentIndex(1)
+            return True
+        self._show_model(NDArrayModel(array))
+        self._displayed_source = array
+        return True
+
+    def _route_series(self, series):
+        if (series is self._displayed_source
+                and self.table_view.model() is not None):
+            self.tabs.setCurrentIndex(1)
+            return True
+        # reshape(-1, 1) is a view; the Series' buffer is not copied
+        self._show_model(NDArrayModel(series.to_numpy().reshape(-1, 1),
+                                      columns=[series.name or "value"]))
+        self._displayed_source = series
+        return True
+
+    def _render_figure(self, figure):
+        self.tabs.setCurrentIndex(0)  # Plot Tab
+        if self._canvas is not None and figure is self._canvas.figure:
+            # Already bound (an operation mutated its figure in place):
+            # skip the rebind/resize round-trip and just request a redraw.
+            self.canvas.draw_idle()
+            return
+        # Background and artists belong to the outgoing figure
+        self._blit_background = None
+        self._blit_artists = []
+        self.canvas.figure = figure
+        figure.set_canvas(self.canvas)
+        # The callback registry rides on the figure, so the swap dropped
+        # the draw_event hook registered against the old one
+        self.canvas.mpl_connect("draw_event", self._on_full_draw)
+        # draw_idle: rapid reroutes (selection dragging) coalesce into
+        # one rasterization on the next event-loop pass
+        self.canvas.draw_idle()
+
+    def prepare_for_blit(self, artists):
+        """Captures the current figure as a blit background.
+
+        Callers animating a handful of artists (e.g. a sweep line over a
+        persistence diagram) call this once, then update_blit() per
+        frame: only the changed artists are re-rasterized instead of the
+        whole axes.
+        """
+        self._blit_artists = list(artists)
+        # The draw_event hook captures the background from this draw
         self.canvas.draw()
-        self.table_view.setModel(None)
+
+    def _on_full_draw(self, _event):
+        if self._blit_artists and self.canvas.figure.get_axes():
+            self._blit_background = self.canvas.copy_from_bbox(
+                self.canvas.figure.bbox)
+
+    def update_blit(self):
+        """Redraws just the registered artists over the cached background."""
+        if self._blit_background is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._blit_background)
+        for artist in self._blit_artists:
+            artist.axes.draw_artist(artist)
+        self.canvas.blit(self.canvas.figure.bbox)
+
+    def _render_table(self, df):
+        self._show_model(PandasModel(df))
+
+    def _show_model(self, model):
+        self.tabs.setCurrentIndex(1)  # Table Tab
+        if self._canvas is not None and self._canvas.figure.get_axes():
+            self._blit_background = None
+            self._blit_artists = []
+            self._canvas.figure.clear()
+            self._canvas.draw_idle()
+        self.table_view.setModel(model)
 
     def set_node(self, node):
         """
@@ -105,10 +496,11 @@ class VizPanel(QWidget):
         """Generates a dummy plot for UI testing."""
         ax = self.canvas.figure.add_subplot(111)
         if op_type == "PersistencePlot":
-            # Draw a mock persistence diagram (points above diagonal)
-            x = np.random.rand(20)
-            y = x + np.random.rand(20) * 0.5
-            ax.scatter(x, y, c='blue', alpha=0.6)
+            # Draw a mock persistence diagram (points above diagonal).
+            # Sampled in one (20, 2) draw rather than per-axis calls.
+            pts = _RNG.random((20, 2))
+            pts[:, 1] = pts[:, 0] + pts[:, 1] * 0.5
+            ax.scatter(pts[:, 0], pts[:, 1], c='blue', alpha=0.6)
             ax.plot([0, 1], [0, 1], 'k--', alpha=0.5) # Diagonal
             ax.set_title("Persistence Diagram (Mock)")
         else:
@@ -118,20 +510,18 @@ class VizPanel(QWidget):
             ax.plot(x, y)
             ax.set_title("Time Series (Mock)")
             
-        self.canvas.draw()
+        self.canvas.draw_idle()
 
     def _mock_render_table(self, op_type):
-        """Generates a dummy table for UI testing."""
-        if op_type == "CSVLoader":
-            data = pd.DataFrame({
-                'Date': pd.date_range(start='1/1/2023', periods=5),
-                'Price': np.random.rand(5) * 100,
-                'Volume': np.random.randint(100, 1000, 5)
-            })
-        elif op_type == "SlidingWindow":
-            data = pd.DataFrame(np.random.rand(5, 4), columns=['t-3', 't-2', 't-1', 't'])
-        else:
-            data = pd.DataFrame({'Info': ['No data available']})
-            
-        model = PandasModel(data)
-        self.table_view.setModel(model)
+        """Generates a dummy table for UI testing (built off-thread)."""
+        self._table_generation += 1
+        runnable = _MockTableRunnable(self._table_generation, op_type)
+        runnable.signals.finished.connect(
+            self._on_mock_table_ready, Qt.ConnectionType.QueuedConnection)
+        QThreadPool.globalInstance().start(runnable)
+
+    @pyqtSlot(int, object)
+    def _on_mock_table_ready(self, generation, data):
+        if generation != self._table_generation:
+            return  # A newer selection superseded this build
+        self.table_view.setModel(PandasModel(data))
@@ -3,9 +3,9 @@ import os
 import tempfile
 import pandas as pd
 import numpy as np
-from src.persistra.core.project import Project, Node, Socket, Operation
-from src.persistra.core.objects import DataWrapper, TimeSeries, IntParam
-from src.persistra.core.io import save_project, load_project
+from persistra.core.project import Project, Node, Socket, Operation
+from persistra.core.objects import DataWrapper, TimeSeries, IntParam
+from persistra.core.io import save_project, load_project
 
 # --- Mock Operations for Testing ---
 
@@ -38,10 +38,8 @@ class TestGraphCore(unittest.TestCase):
     
     def setUp(self):
         self.project = Project()
-        self.node_a = Node(MockSourceOp)
-        self.node_b = Node(MockTransformOp)
-        self.project.add_node(self.node_a)
-        self.project.add_node(self.node_b)
+        self.node_a = self.project.add_node(MockSourceOp)
+        self.node_b = self.project.add_node(MockTransformOp)
 
     def test_node_instantiation(self):
         """Test if nodes render sockets and parameters correctly."""
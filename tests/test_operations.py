@@ -4,9 +4,9 @@ import numpy as np
 import tempfile
 import os
 
-from src.persistra.operations.io import CSVLoader
-from src.persistra.operations.tda import SlidingWindow, PointCloud
-from src.persistra.core.objects import TimeSeries
+from persistra.operations.io import CSVLoader
+from persistra.operations.tda import SlidingWindow, PointCloud
+from persistra.core.objects import TimeSeries
 
 class TestOperations(unittest.TestCase):
 
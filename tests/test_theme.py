@@ -0,0 +1,56 @@
+import os
+import tempfile
+import unittest
+
+os.environ.setdefault("PERSISTRA_HOME", tempfile.mkdtemp(prefix="persistra-test-"))
+
+import persistra.ui.theme as theme
+from persistra.ui.theme import THEMES, ThemeManager
+from persistra.ui.theme.stylesheets import generate_stylesheet
+
+
+class TestThemeManager(unittest.TestCase):
+
+    def setUp(self):
+        # The manager is a singleton; start each test from a fresh instance.
+        # Toggle throttling is disabled so tests can flip themes freely.
+        theme._TOGGLE_THROTTLE_S = 0.0
+        ThemeManager._instance = None
+        self.manager = ThemeManager()
+
+    def test_defaults_to_dark(self):
+        self.assertEqual(self.manager.current_theme, "dark")
+        self.assertIs(self.manager.current_tokens, THEMES["dark"])
+
+    def test_toggle_switches_tokens(self):
+        self.manager.toggle()
+        self.assertEqual(self.manager.current_theme, "light")
+        self.assertIs(self.manager.current_tokens, THEMES["light"])
+        self.manager.toggle()
+        self.assertEqual(self.manager.current_theme, "dark")
+
+    def test_toggle_persists_preference(self):
+        self.manager.toggle()
+        ThemeManager._instance = None
+        reloaded = ThemeManager()
+        self.assertEqual(reloaded.current_theme, "light")
+        reloaded.toggle()  # restore dark for other tests
+
+    def test_category_color_lookup(self):
+        tokens = self.manager.current_tokens
+        self.assertEqual(self.manager.get_category_color("TDA"),
+                         tokens.category_tda)
+        # Unknown categories fall back to the utility color.
+        self.assertEqual(self.manager.get_category_color("No Such Category"),
+                         tokens.category_utility)
+
+    def test_qss_precomputed_per_theme(self):
+        # Stylesheets for the bundled themes are constants built at import.
+        self.assertEqual(set(theme.THEMES_QSS), {"dark", "light"})
+        qss = theme.THEMES_QSS["dark"]
+        self.assertIn(THEMES["dark"].background, qss)
+        self.assertEqual(generate_stylesheet(THEMES["dark"]), qss)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import unittest
+from persistra.core.objects import (DataWrapper, TimeSeries, DistanceMatrix,
+                                    PersistenceDiagram)
+from persistra.core.types import (ANY, AnyType, ConcreteType, SocketDef,
+                                  UnionType, _concrete_accepts)
+
+
+class TestSocketTypeHierarchy(unittest.TestCase):
+
+    def test_concrete_exact_match(self):
+        self.assertTrue(ConcreteType(TimeSeries).accepts(ConcreteType(TimeSeries)))
+
+    def test_concrete_subclass_accepts(self):
+        """A DataWrapper socket accepts any wrapper subclass."""
+        self.assertTrue(ConcreteType(DataWrapper).accepts(ConcreteType(TimeSeries)))
+        self.assertFalse(ConcreteType(TimeSeries).accepts(ConcreteType(DataWrapper)))
+
+    def test_concrete_dtype_mismatch(self):
+        target = ConcreteType(DistanceMatrix, dtype="float64")
+        self.assertFalse(target.accepts(ConcreteType(DistanceMatrix, dtype="int32")))
+        # An unconstrained dtype on either side is compatible
+        self.assertTrue(target.accepts(ConcreteType(DistanceMatrix)))
+
+    def test_concrete_shape_match(self):
+        target = ConcreteType(DistanceMatrix, shape=(None, 3))
+        self.assertTrue(target.accepts(ConcreteType(DistanceMatrix, shape=(100, 3))))
+
+    def test_concrete_shape_mismatch(self):
+        target = ConcreteType(DistanceMatrix, shape=(None, 3))
+        self.assertFalse(target.accepts(ConcreteType(DistanceMatrix, shape=(100, 2))))
+        self.assertFalse(target.accepts(ConcreteType(DistanceMatrix, shape=(100,))))
+
+    def test_union_accepts_any_member(self):
+        union = UnionType(ConcreteType(TimeSeries), ConcreteType(DistanceMatrix))
+        self.assertTrue(union.accepts(ConcreteType(TimeSeries)))
+        self.assertTrue(union.accepts(ConcreteType(DistanceMatrix)))
+        self.assertFalse(union.accepts(ConcreteType(PersistenceDiagram)))
+
+    def test_any_accepts_everything(self):
+        any_type = AnyType()
+        self.assertTrue(any_type.accepts(ConcreteType(TimeSeries)))
+        self.assertTrue(any_type.accepts(UnionType(ConcreteType(DistanceMatrix))))
+        self.assertTrue(any_type.accepts(AnyType()))
+
+    def test_union_accepts_member_subclass(self):
+        """A source class not indexed exactly still matches via scan."""
+        union = UnionType(ConcreteType(DataWrapper))
+        self.assertTrue(union.accepts(ConcreteType(TimeSeries)))
+
+    def test_any_is_singleton(self):
+        self.assertIs(AnyType(), ANY)
+        self.assertTrue(ConcreteType(TimeSeries).accepts(AnyType()))
+
+    def test_constraints_are_interned(self):
+        a = ConcreteType(DistanceMatrix, dtype="float64", shape=(None, 3))
+        b = ConcreteType(DistanceMatrix, dtype="float64", shape=(None, 3))
+        self.assertIs(a.shape, b.shape)
+        self.assertIs(a.dtype, b.dtype)
+
+    def test_pairwise_decision_is_cached(self):
+        """Equal type pairs hit the memoized decision, not a fresh walk."""
+        _concrete_accepts.cache_clear()
+        a, b = ConcreteType(DataWrapper), ConcreteType(TimeSeries)
+        a.accepts(b)
+        misses = _concrete_accepts.cache_info().misses
+        # Distinct but equal instances share the cache entry
+        ConcreteType(DataWrapper).accepts(ConcreteType(TimeSeries))
+        self.assertEqual(_concrete_accepts.cache_info().misses, misses)
+        self.assertGreater(_concrete_accepts.cache_info().hits, 0)
+
+
+class TestSocketDefCache(unittest.TestCase):
+
+    def test_defs_shared_across_nodes(self):
+        """Nodes of one operation class share normalized SocketDefs."""
+        from persistra.core.project import Node, Operation, _socket_defs
+
+        class DefOp(Operation):
+            name = "Def Op"
+            def __init__(self):
+                super().__init__()
+                self.inputs = [{'name': 'src', 'type': DataWrapper}]
+                self.outputs = [{'name': 'out', 'type': TimeSeries}]
+
+        node_a, node_b = Node(DefOp), Node(DefOp)
+        self.assertIs(_socket_defs(node_a.operation),
+                      _socket_defs(node_b.operation))
+        self.assertEqual(node_a.input_sockets[0].name, 'src')
+        self.assertIs(node_b.output_sockets[0].data_type, TimeSeries)
+
+    def test_socketdef_is_frozen(self):
+        definition = SocketDef('src', DataWrapper)
+        with self.assertRaises(AttributeError):
+            definition.name = 'other'
+
+
+if __name__ == '__main__':
+    unittest.main()
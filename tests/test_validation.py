@@ -0,0 +1,59 @@
+import unittest
+
+from persistra.core.project import Project, Operation
+from persistra.core.objects import DataWrapper
+from persistra.core.validation import GraphValidator
+
+# --- Mock Operations for Testing ---
+
+class MockSourceOp(Operation):
+    name = "Mock Source"
+    def __init__(self):
+        super().__init__()
+        self.outputs = [{'name': 'out', 'type': DataWrapper}]
+
+    def execute(self, inputs, params):
+        return {'out': DataWrapper(1)}
+
+class MockSinkOp(Operation):
+    name = "Mock Sink"
+    def __init__(self):
+        super().__init__()
+        self.inputs = [{'name': 'src', 'type': DataWrapper}]
+
+    def execute(self, inputs, params):
+        return {}
+
+# --- Tests ---
+
+class TestGraphValidator(unittest.TestCase):
+
+    def setUp(self):
+        self.project = Project()
+        self.source = self.project.add_node(MockSourceOp)
+        self.sink = self.project.add_node(MockSinkOp)
+        self.validator = GraphValidator()
+
+    def test_disconnected_input_is_error(self):
+        messages = self.validator.validate(self.project)
+        errors = [m for m in messages if m.level == "error"]
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(errors[0].node_id, self.sink.id)
+
+    def test_orphan_node_is_warning(self):
+        messages = self.validator.validate(self.project)
+        warnings = [m for m in messages if m.level == "warning"]
+        # Both nodes are unconnected, so both are orphans
+        self.assertEqual(len(warnings), 2)
+
+    def test_connected_graph_is_clean(self):
+        self.project.connect(self.source, 'out', self.sink, 'src')
+        messages = self.validator.validate(self.project)
+        self.assertEqual(messages, [])
+
+    def test_dirty_subset_limits_scope(self):
+        messages = self.validator.validate(self.project, dirty={self.sink.id})
+        self.assertTrue(all(m.node_id == self.sink.id for m in messages))
+
+if __name__ == '__main__':
+    unittest.main()